@@ -4,11 +4,22 @@
 # =====================================
 
 import os
+import re
 import json
+import base64
+import gzip
+import hashlib
+import random
+import time
 import asyncio
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from urllib.parse import urlsplit
+from datetime import datetime, timezone
 import logging
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
 
 # MCP Client imports
 try:
@@ -26,8 +37,212 @@ except ImportError:
             pass
     MCP_AVAILABLE = False
 
+# Direct Firecrawl HTTP client for small jobs that don't justify the MCP server
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Direct GitHub REST client for multi-file commits through the Git Data API
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Faster JSON encoding for generated files and API request bodies
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+GITHUB_API_URL = "https://api.github.com"
+# Opt-in gzip request bodies for blob uploads (falls back if GitHub rejects them)
+GITHUB_GZIP_REQUESTS = os.getenv("GITHUB_GZIP_REQUESTS") == "1"
+GZIP_MIN_BYTES = 1024
+FIRECRAWL_SCRAPE_URL = "https://api.firecrawl.dev/v1/scrape"
+FIRECRAWL_DIRECT_MAX_URLS = 3
+
+# Retry policy for direct GitHub / Firecrawl HTTP calls
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MAX_DELAY = 60.0
+
 logger = logging.getLogger(__name__)
 
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+def _is_retryable(status: int, headers) -> bool:
+    """Whether an HTTP response is a transient failure or a rate limit"""
+    if status in RETRY_STATUSES:
+        return True
+    return status == 403 and headers.get("X-RateLimit-Remaining") == "0"
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring rate-limit headers"""
+    delay = 2 ** attempt * 0.5 + random.random()
+    
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    elif headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset", "").isdigit():
+        delay = max(delay, int(headers["X-RateLimit-Reset"]) - time.time())
+    
+    return min(delay, RETRY_MAX_DELAY)
+
+def _url_key(url: str) -> str:
+    """Comparable form of a URL, ignoring scheme, www., case of the host and trailing slashes"""
+    parts = urlsplit(url.strip() if "://" in url else f"//{url.strip()}")
+    key = parts.netloc.lower().removeprefix("www.") + parts.path.rstrip("/")
+    return f"{key}?{parts.query}" if parts.query else key
+
+# Firecrawl MCP errors meaning the server has no such tool (as opposed to a failed call)
+_MISSING_TOOL_RE = re.compile(r'unknown tool|tool\b.*\bnot found|method not found', re.IGNORECASE)
+
+# Markdown patterns used by the scraped-content analysis (compiled once)
+_H1_RE = re.compile(r'# (.+)')
+_H2_RE = re.compile(r'## (.+)')
+_H3_RE = re.compile(r'### (.+)')
+_H4_RE = re.compile(r'#### (.+)')
+_INTERNAL_LINK_RE = re.compile(r'\[.+\]\(\/[^)]+\)')
+_EXTERNAL_LINK_RE = re.compile(r'\[.+\]\(https?:\/\/[^)]+\)')
+_IMAGE_RE = re.compile(r'!\[.*\]\([^)]+\)')
+
+# Page categorisation for crawled sites; the first keyword found in the URL wins
+_PAGE_CATEGORY_RE = re.compile(r'(?P<services>service)|(?P<about>about)|(?P<contact>contact)|(?P<blog>blog|news|article)')
+_PAGE_CATEGORIES = ("homepage", "services", "about", "contact", "blog", "other")
+_INDEX_PAGES = frozenset(("", "index.html", "index.php"))
+
+# Crawls larger than this are analysed in chunks on a process pool
+CRAWL_PARALLEL_THRESHOLD = 100
+CRAWL_CHUNK_SIZE = 100
+
+# =============================================================================
+# SITE STRUCTURE ANALYSIS
+# Module-level so crawl chunks can be analysed in worker processes
+# =============================================================================
+
+def _site_structure_totals(pages: List[Dict]) -> Dict:
+    """Collect mergeable site-structure totals for a list of crawled pages"""
+    totals = {
+        "pages": len(pages),
+        "page_types": Counter(dict.fromkeys(_PAGE_CATEGORIES, 0)),
+        "url_length_sum": 0,
+        "hyphen_urls": 0,
+        "underscore_urls": 0,
+        "max_depth": None,
+        "content_length_sum": 0,
+        "min_content_length": None,
+        "max_content_length": None,
+        "substantial_pages": 0,
+        "meta_descriptions": 0,
+        "proper_titles": 0
+    }
+    page_types = totals["page_types"]
+    
+    for page in pages:
+        url = page.get("url", "")
+        
+        # Parse the URL once, without touching the caller's page dict
+        parts = urlsplit(url)
+        path = parts.path.lower()
+        
+        # Page type
+        if path.endswith("/") or path.rsplit("/", 1)[-1] in _INDEX_PAGES:
+            page_types["homepage"] += 1
+        else:
+            match = _PAGE_CATEGORY_RE.search(path)
+            page_types[match.lastgroup if match else "other"] += 1
+        
+        # URL patterns
+        totals["url_length_sum"] += len(url)
+        if "-" in url:
+            totals["hyphen_urls"] += 1
+        if "_" in url:
+            totals["underscore_urls"] += 1
+        if parts.scheme in ("http", "https"):
+            depth = parts.path.count("/")
+            if totals["max_depth"] is None or depth > totals["max_depth"]:
+                totals["max_depth"] = depth
+        
+        # Content distribution
+        content_length = len(page.get("content", ""))
+        totals["content_length_sum"] += content_length
+        if totals["min_content_length"] is None or content_length < totals["min_content_length"]:
+            totals["min_content_length"] = content_length
+        if totals["max_content_length"] is None or content_length > totals["max_content_length"]:
+            totals["max_content_length"] = content_length
+        if content_length > 1000:
+            totals["substantial_pages"] += 1
+        
+        # Technical insights
+        metadata = page.get("metadata", {})
+        if metadata.get("description"):
+            totals["meta_descriptions"] += 1
+        if metadata.get("title") and 30 <= len(metadata["title"]) <= 60:
+            totals["proper_titles"] += 1
+    
+    return totals
+
+def _merge_site_structure_totals(partials: List[Dict]) -> Dict:
+    """Merge totals computed for separate chunks of the same crawl"""
+    merged = _site_structure_totals([])
+    
+    for partial in partials:
+        merged["page_types"].update(partial["page_types"])
+        for key in ("pages", "url_length_sum", "hyphen_urls", "underscore_urls",
+                    "content_length_sum", "substantial_pages", "meta_descriptions", "proper_titles"):
+            merged[key] += partial[key]
+        for key, pick in (("max_depth", max), ("min_content_length", min), ("max_content_length", max)):
+            values = [v for v in (merged[key], partial[key]) if v is not None]
+            merged[key] = pick(values) if values else None
+    
+    return merged
+
+def _finalize_site_structure(totals: Dict) -> Dict:
+    """Turn site-structure totals into the structure analysis report"""
+    page_count = totals["pages"]
+    
+    if page_count:
+        content_distribution = {
+            "avg_content_length": totals["content_length_sum"] / page_count,
+            "min_content_length": totals["min_content_length"],
+            "max_content_length": totals["max_content_length"],
+            "pages_with_substantial_content": totals["substantial_pages"]
+        }
+    else:
+        content_distribution = {"error": "No content found"}
+    
+    return {
+        "total_pages": page_count,
+        "page_types": dict(totals["page_types"]),
+        "url_structure": {
+            "avg_url_length": totals["url_length_sum"] / page_count if page_count else 0,
+            "uses_hyphens": totals["hyphen_urls"] / page_count if page_count else 0,
+            "uses_underscores": totals["underscore_urls"] / page_count if page_count else 0,
+            "max_depth": totals["max_depth"] or 0
+        },
+        "content_distribution": content_distribution,
+        "technical_insights": {
+            "total_pages_crawled": page_count,
+            "pages_with_meta_description": totals["meta_descriptions"],
+            "pages_with_proper_titles": totals["proper_titles"],
+            "average_load_time": 0  # Would need actual timing data
+        }
+    }
+
 # =============================================================================
 # GITHUB MCP INTEGRATION
 # =============================================================================
@@ -38,9 +253,15 @@ class GitHubMCP:
     def __init__(self):
         self.client = None
         self.initialized = False
+        self._owner = os.getenv("GITHUB_OWNER")
+        self._session = None
+        self._gzip_requests = GITHUB_GZIP_REQUESTS
         
     async def initialize(self):
         """Initialize GitHub MCP connection"""
+        if AIOHTTP_AVAILABLE and os.getenv("GITHUB_TOKEN"):
+            self._get_session()
+        
         if not MCP_AVAILABLE:
             logger.warning("MCP not available - using fallback mode")
             self.initialized = True
@@ -103,16 +324,141 @@ class GitHubMCP:
             logger.error(f"Failed to create GitHub repository: {e}")
             return {"success": False, "error": str(e)}
     
-    async def commit_website_files(self, repo_name: str, website_files: Dict[str, str]) -> Dict:
-        """Commit all website files to GitHub repository"""
+    async def commit_website_files(self, repo_name: str, website_files: List[Tuple[str, bytes]]) -> Dict:
+        """Commit all website files to GitHub repository
+        
+        ``website_files`` is a list of (path, UTF-8 bytes) pairs.
+        
+        Files go into a single commit built with the Git Data API (blobs,
+        tree, commit, ref update). Without aiohttp or a GITHUB_TOKEN the
+        files are committed one by one through the MCP server.
+        """
         if not self.initialized:
             await self.initialize()
+        
+        if not AIOHTTP_AVAILABLE or not os.getenv("GITHUB_TOKEN"):
+            return await self._commit_files_individually(repo_name, website_files)
             
+        try:
+            repo_path = await self._repo_path(repo_name)
+            
+            # Current head of main and its tree
+            ref = await self._github_api("GET", f"/repos/{repo_path}/git/ref/heads/main")
+            parent_sha = ref["object"]["sha"]
+            parent = await self._github_api("GET", f"/repos/{repo_path}/git/commits/{parent_sha}")
+            
+            # Upload every file as a blob concurrently
+            paths = [path for path, _ in website_files]
+            blobs = await asyncio.gather(*[
+                self._github_api("POST", f"/repos/{repo_path}/git/blobs", {
+                    "content": base64.b64encode(content).decode("ascii"),
+                    "encoding": "base64"
+                }, compress=True)
+                for _, content in website_files
+            ])
+            
+            # One tree and one commit for all files, then move main
+            tree = await self._github_api("POST", f"/repos/{repo_path}/git/trees", {
+                "base_tree": parent["tree"]["sha"],
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "sha": blob["sha"]}
+                    for path, blob in zip(paths, blobs)
+                ]
+            })
+            commit = await self._github_api("POST", f"/repos/{repo_path}/git/commits", {
+                "message": f"Add {len(paths)} SEO optimized website files",
+                "tree": tree["sha"],
+                "parents": [parent_sha]
+            })
+            await self._github_api("PATCH", f"/repos/{repo_path}/git/refs/heads/main", {
+                "sha": commit["sha"]
+            })
+            
+            timestamp = datetime.utcnow().isoformat()
+            return {
+                "success": True,
+                "total_files": len(website_files),
+                "commits": [
+                    {"file": path, "commit_sha": commit["sha"], "timestamp": timestamp}
+                    for path in paths
+                ],
+                "repository": repo_name
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to commit website files: {e}")
+            return {"success": False, "error": str(e)}
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared GitHub API session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "Authorization": f"token {os.getenv('GITHUB_TOKEN')}",
+                    "Accept": "application/vnd.github.v3+json"
+                },
+                connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=30),
+                auto_decompress=True
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared GitHub API session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _repo_path(self, repo_name: str) -> str:
+        """Resolve a repository name to owner/name"""
+        if "/" in repo_name:
+            return repo_name
+        if not self._owner:
+            user = await self._github_api("GET", "/user")
+            self._owner = user["login"]
+        return f"{self._owner}/{repo_name}"
+    
+    async def _github_api(self, method: str, path: str, body: Optional[Dict] = None,
+                          compress: bool = False) -> Dict:
+        """Make a GitHub REST API call and return the decoded JSON response
+        
+        Transient errors and rate limits are retried with exponential backoff.
+        With ``compress`` (and GITHUB_GZIP_REQUESTS=1) large bodies are sent
+        gzip-encoded; if GitHub rejects that, the body is resent uncompressed
+        and compression is disabled for this client.
+        """
+        data = _json_bytes(body) if body is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else None
+        gzipped = compress and self._gzip_requests and data is not None and len(data) >= GZIP_MIN_BYTES
+        payload = gzip.compress(data) if gzipped else data
+        
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            async with self._get_session().request(
+                method,
+                f"{GITHUB_API_URL}{path}",
+                data=payload,
+                headers={**headers, "Content-Encoding": "gzip"} if gzipped else headers
+            ) as response:
+                if gzipped and attempt < RETRY_MAX_ATTEMPTS - 1 and response.status in (400, 415, 422):
+                    logger.warning("GitHub rejected a gzip request body; sending uncompressed")
+                    self._gzip_requests = gzipped = False
+                    payload = data
+                    delay = 0
+                elif attempt < RETRY_MAX_ATTEMPTS - 1 and _is_retryable(response.status, response.headers):
+                    delay = _retry_delay(response.headers, attempt)
+                    logger.warning(f"GitHub {method} {path} returned {response.status}, retrying in {delay:.1f}s")
+                else:
+                    response.raise_for_status()
+                    return await response.json()
+            await asyncio.sleep(delay)
+    
+    async def _commit_files_individually(self, repo_name: str, website_files: List[Tuple[str, bytes]]) -> Dict:
+        """Commit website files one at a time through the MCP server"""
         try:
             commits = []
             
             # Commit files in batches to avoid API limits
-            file_batches = self._batch_files(website_files, batch_size=10)
+            text_files = {path: content.decode("utf-8") for path, content in website_files}
+            file_batches = self._batch_files(text_files, batch_size=10)
             
             for batch_num, file_batch in enumerate(file_batches):
                 for filepath, content in file_batch.items():
@@ -338,14 +684,25 @@ jobs:
 # =============================================================================
 
 class FirecrawlMCP:
-    """Firecrawl MCP integration for web scraping and competitor analysis"""
+    """Firecrawl MCP integration for web scraping and competitor analysis
+    
+    Intended as a long-lived singleton per process: the MCP connection and
+    HTTP connection pool are reused by every scrape. Call ``aclose()`` on
+    shutdown.
+    """
     
     def __init__(self):
         self.client = None
         self.initialized = False
+        self.batch_scrape_supported = True
+        self._http = None
+        self._ppe = None
         
     async def initialize(self):
         """Initialize Firecrawl MCP connection"""
+        if HTTPX_AVAILABLE:
+            self._get_http_client()
+        
         if not MCP_AVAILABLE:
             logger.warning("MCP not available - using fallback mode")
             self.initialized = True
@@ -368,9 +725,15 @@ class FirecrawlMCP:
             logger.error(f"Failed to initialize Firecrawl MCP: {e}")
             raise
     
-    async def scrape_competitor_website(self, url: str, extract_options: Dict = None) -> Dict:
-        """Scrape competitor website for SEO analysis"""
-        if not self.initialized:
+    async def scrape_competitor_website(self, url: str, extract_options: Dict = None,
+                                        scraped_at: Optional[str] = None) -> Dict:
+        """Scrape competitor website for SEO analysis
+        
+        Batch callers pass a shared ``scraped_at`` timestamp so one is not
+        formatted per URL.
+        """
+        direct = self._should_scrape_direct(1)
+        if not direct and not self.initialized:
             await self.initialize()
             
         try:
@@ -382,19 +745,20 @@ class FirecrawlMCP:
                 "waitFor": 2000
             }
             
-            result = await self.client.call_tool(
-                "firecrawl_scrape",
-                {
-                    "url": url,
-                    "formats": options.get("formats", ["markdown"]),
-                    "includeTags": options.get("includeTags", []),
-                    "excludeTags": options.get("excludeTags", []),
-                    "onlyMainContent": options.get("onlyMainContent", True),
-                    "waitFor": options.get("waitFor", 2000)
-                }
-            )
+            payload = {
+                "url": url,
+                "formats": options.get("formats", ["markdown"]),
+                "includeTags": options.get("includeTags", []),
+                "excludeTags": options.get("excludeTags", []),
+                "onlyMainContent": options.get("onlyMainContent", True),
+                "waitFor": options.get("waitFor", 2000)
+            }
             
-            scraped_data = json.loads(result.content[0].text) if result.content else {}
+            if direct:
+                scraped_data = await self._scrape_direct(payload)
+            else:
+                result = await self.client.call_tool("firecrawl_scrape", payload)
+                scraped_data = json.loads(result.content[0].text) if result.content else {}
             
             # Extract SEO-relevant information
             seo_analysis = self._analyze_scraped_content(scraped_data)
@@ -402,7 +766,7 @@ class FirecrawlMCP:
             return {
                 "success": True,
                 "url": url,
-                "scraped_at": datetime.utcnow().isoformat(),
+                "scraped_at": scraped_at or datetime.now(timezone.utc).isoformat(timespec='seconds'),
                 "content": scraped_data,
                 "seo_analysis": seo_analysis
             }
@@ -433,7 +797,10 @@ class FirecrawlMCP:
             crawl_data = json.loads(result.content[0].text) if result.content else {}
             
             # Analyze site structure for SEO insights
-            structure_analysis = self._analyze_site_structure(crawl_data)
+            if len(crawl_data.get("pages", [])) > CRAWL_PARALLEL_THRESHOLD:
+                structure_analysis = await self._analyze_site_structure_parallel(crawl_data)
+            else:
+                structure_analysis = self._analyze_site_structure(crawl_data)
             
             return {
                 "success": True,
@@ -448,57 +815,232 @@ class FirecrawlMCP:
             logger.error(f"Failed to crawl website {base_url}: {e}")
             return {"success": False, "base_url": base_url, "error": str(e)}
     
-    async def batch_competitor_analysis(self, competitor_urls: List[str]) -> Dict:
-        """Analyze multiple competitor websites"""
-        if not self.initialized:
+    async def batch_competitor_analysis(self, competitor_urls: List[str], max_concurrency: int = 5) -> Dict:
+        """Analyze multiple competitor websites
+        
+        Per-URL scrapes run concurrently, at most ``max_concurrency`` at once.
+        """
+        batch_started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        
+        if not competitor_urls:
+            return {
+                "success": True,
+                "batch_started_at": batch_started_at,
+                "analyzed_at": batch_started_at,
+                "total_competitors": 0,
+                "successful_analyses": 0,
+                "individual_results": [],
+                "competitive_intelligence": self._aggregate_competitor_data([])
+            }
+        
+        direct = self._should_scrape_direct(len(competitor_urls))
+        if not direct and not self.initialized:
             await self.initialize()
-            
-        results = []
         
-        for url in competitor_urls:
-            try:
-                # Scrape individual competitor
-                scrape_result = await self.scrape_competitor_website(url)
-                results.append(scrape_result)
-                
-                # Small delay to be respectful
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Failed to analyze competitor {url}: {e}")
-                results.append({
-                    "success": False,
-                    "url": url,
-                    "error": str(e)
-                })
+        # Prefer a single server-side batch job; anything it doesn't return is scraped per URL
+        results = None if direct else await self._batch_scrape(competitor_urls, batch_started_at)
+        if results is None:
+            results = [None] * len(competitor_urls)
+        missing = [i for i, scrape_result in enumerate(results) if scrape_result is None]
+        
+        if missing:
+            # Scrape individual competitors, a few at a time
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def scrape_one(url: str) -> Dict:
+                async with semaphore:
+                    return await self.scrape_competitor_website(url, scraped_at=batch_started_at)
+            
+            gathered = await asyncio.gather(
+                *[scrape_one(competitor_urls[i]) for i in missing],
+                return_exceptions=True
+            )
+            
+            for i, scrape_result in zip(missing, gathered):
+                if isinstance(scrape_result, Exception):
+                    logger.error(f"Failed to analyze competitor {competitor_urls[i]}: {scrape_result}")
+                    scrape_result = {
+                        "success": False,
+                        "url": competitor_urls[i],
+                        "error": str(scrape_result)
+                    }
+                results[i] = scrape_result
         
         # Aggregate competitive intelligence
         competitive_intelligence = self._aggregate_competitor_data(results)
         
         return {
             "success": True,
-            "analyzed_at": datetime.utcnow().isoformat(),
+            "batch_started_at": batch_started_at,
+            "analyzed_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
             "total_competitors": len(competitor_urls),
-            "successful_analyses": len([r for r in results if r.get("success")]),
+            "successful_analyses": sum(1 for r in results if r.get("success")),
             "individual_results": results,
             "competitive_intelligence": competitive_intelligence
         }
     
+    def _should_scrape_direct(self, url_count: int) -> bool:
+        """Decide whether to call the Firecrawl HTTP API instead of the MCP server
+        
+        FIRECRAWL_DIRECT=1 forces the direct path. Otherwise small jobs go
+        direct as long as the MCP server has not been started yet.
+        """
+        if not HTTPX_AVAILABLE or not os.getenv("FIRECRAWL_API_KEY"):
+            return False
+        if os.getenv("FIRECRAWL_DIRECT") == "1":
+            return True
+        return not self.initialized and url_count < FIRECRAWL_DIRECT_MAX_URLS
+    
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client for direct Firecrawl calls"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the MCP connection and the shared HTTP client"""
+        if self.client is not None and hasattr(self.client, "close"):
+            await self.client.close()
+        self.client = None
+        self.initialized = False
+        
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        
+        if self._ppe is not None:
+            self._ppe.shutdown(wait=False)
+            self._ppe = None
+    
+    async def _scrape_direct(self, payload: Dict) -> Dict:
+        """Scrape a single URL through the Firecrawl HTTP API"""
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            response = await self._get_http_client().post(
+                FIRECRAWL_SCRAPE_URL,
+                json=payload,
+                headers={"Authorization": f"Bearer {os.getenv('FIRECRAWL_API_KEY')}"}
+            )
+            if attempt < RETRY_MAX_ATTEMPTS - 1 and _is_retryable(response.status_code, response.headers):
+                await asyncio.sleep(_retry_delay(response.headers, attempt))
+                continue
+            response.raise_for_status()
+            break
+        
+        data = response.json().get("data", {})
+        return {**data, "content": data.get("content") or data.get("markdown", "")}
+    
+    async def _batch_scrape(self, urls: List[str], scraped_at: str,
+                            max_wait: float = 120.0) -> Optional[List[Optional[Dict]]]:
+        """Scrape all URLs through Firecrawl's batch endpoint
+        
+        Returns one result per URL, with None for URLs the job did not return
+        (e.g. it failed or timed out) so the caller can scrape just those. Returns
+        None when the job cannot be started. Batch mode is only switched off for
+        the process when the MCP server has no batch tool.
+        """
+        if not self.batch_scrape_supported or self.client is None or len(urls) < 2:
+            return None
+        
+        try:
+            result = await self.client.call_tool(
+                "firecrawl_batch_scrape",
+                {
+                    "urls": urls,
+                    "options": {
+                        "formats": ["markdown"],
+                        "onlyMainContent": True
+                    }
+                }
+            )
+            text = result.content[0].text if result.content else ""
+            if getattr(result, "isError", False):
+                raise RuntimeError(text or "batch scrape failed")
+            job_id = json.loads(text).get("id") if text else None
+            if not job_id:
+                raise ValueError("batch scrape did not return a job id")
+        except Exception as e:
+            if _MISSING_TOOL_RE.search(str(e)):
+                self.batch_scrape_supported = False
+            logger.info(f"Firecrawl batch scrape unavailable, scraping per URL: {e}")
+            return None
+        
+        # Poll the job with exponential backoff
+        delay = 1.0
+        waited = 0.0
+        status = {}
+        while waited < max_wait:
+            await asyncio.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 15.0)
+            
+            try:
+                result = await self.client.call_tool("firecrawl_check_batch_status", {"id": job_id})
+                status = json.loads(result.content[0].text) if result.content else {}
+            except Exception as e:
+                logger.warning(f"Failed to check batch scrape {job_id}: {e}")
+                continue
+            
+            if status.get("status") in ("completed", "failed"):
+                break
+        
+        if status.get("status") != "completed":
+            outcome = "failed" if status.get("status") == "failed" else f"did not finish within {max_wait:.0f}s"
+            logger.warning(f"Batch scrape {job_id} {outcome}, scraping the missing URLs individually")
+        
+        # Map returned pages back to the requested URLs. Firecrawl normalises
+        # URLs and follows redirects, so match on the source and final URL.
+        pages_by_url = {}
+        for page in status.get("data") or []:
+            metadata = page.get("metadata", {})
+            for page_url in (metadata.get("sourceURL"), metadata.get("url"), page.get("url")):
+                if page_url:
+                    pages_by_url.setdefault(_url_key(page_url), page)
+        
+        results = []
+        for url in urls:
+            page = pages_by_url.get(_url_key(url))
+            if page is None:
+                results.append(None)
+                continue
+            
+            scraped_data = {**page, "content": page.get("content") or page.get("markdown", "")}
+            results.append({
+                "success": True,
+                "url": url,
+                "scraped_at": scraped_at,
+                "content": scraped_data,
+                "seo_analysis": self._analyze_scraped_content(scraped_data)
+            })
+        
+        return results
+    
     def _analyze_scraped_content(self, scraped_data: Dict) -> Dict:
         """Analyze scraped content for SEO insights"""
         content = scraped_data.get("content", "")
         metadata = scraped_data.get("metadata", {})
         
+        scan = self._scan_content(content)
+        
         analysis = {
             "title": metadata.get("title", ""),
             "description": metadata.get("description", ""),
             "keywords": metadata.get("keywords", ""),
             "content_length": len(content),
-            "headings": self._extract_headings(content),
-            "internal_links": self._count_internal_links(content),
-            "external_links": self._count_external_links(content),
-            "images": self._count_images(content),
-            "seo_score": self._calculate_basic_seo_score(metadata, content)
+            "headings": scan["headings"],
+            "internal_links": scan["internal_links"],
+            "external_links": scan["external_links"],
+            "images": scan["images"],
+            "seo_score": self._calculate_basic_seo_score(
+                metadata,
+                content,
+                headings=scan["headings"],
+                image_count=scan["images"],
+                internal_links=scan["internal_links"]
+            )
         }
         
         return analysis
@@ -506,16 +1048,23 @@ class FirecrawlMCP:
     def _analyze_site_structure(self, crawl_data: Dict) -> Dict:
         """Analyze crawled site structure"""
         pages = crawl_data.get("pages", [])
+        return _finalize_site_structure(_site_structure_totals(pages))
+    
+    async def _analyze_site_structure_parallel(self, crawl_data: Dict) -> Dict:
+        """Analyze a large crawl in chunks on a process pool"""
+        pages = crawl_data.get("pages", [])
         
-        structure = {
-            "total_pages": len(pages),
-            "page_types": self._categorize_pages(pages),
-            "url_structure": self._analyze_url_patterns(pages),
-            "content_distribution": self._analyze_content_distribution(pages),
-            "technical_insights": self._extract_technical_insights(pages)
-        }
+        if self._ppe is None:
+            self._ppe = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        chunks = [pages[i:i + CRAWL_CHUNK_SIZE] for i in range(0, len(pages), CRAWL_CHUNK_SIZE)]
+        partials = await asyncio.gather(*[
+            loop.run_in_executor(self._ppe, _site_structure_totals, chunk)
+            for chunk in chunks
+        ])
         
-        return structure
+        return _finalize_site_structure(_merge_site_structure_totals(partials))
     
     def _aggregate_competitor_data(self, results: List[Dict]) -> Dict:
         """Aggregate data from multiple competitors"""
@@ -534,36 +1083,47 @@ class FirecrawlMCP:
         
         return common_patterns
     
+    def _scan_content(self, content: str) -> Dict:
+        """Run every content pattern once so callers can share the counts"""
+        return {
+            "headings": self._extract_headings(content),
+            "internal_links": self._count_internal_links(content),
+            "external_links": self._count_external_links(content),
+            "images": self._count_images(content)
+        }
+    
     def _extract_headings(self, content: str) -> Dict:
         """Extract heading structure from content"""
-        import re
-        
         headings = {
-            "h1": len(re.findall(r'# (.+)', content)),
-            "h2": len(re.findall(r'## (.+)', content)),
-            "h3": len(re.findall(r'### (.+)', content)),
-            "h4": len(re.findall(r'#### (.+)', content))
+            "h1": len(_H1_RE.findall(content)),
+            "h2": len(_H2_RE.findall(content)),
+            "h3": len(_H3_RE.findall(content)),
+            "h4": len(_H4_RE.findall(content))
         }
         
         return headings
     
     def _count_internal_links(self, content: str) -> int:
         """Count internal links in content"""
-        import re
-        return len(re.findall(r'\[.+\]\(\/[^)]+\)', content))
+        return len(_INTERNAL_LINK_RE.findall(content))
     
     def _count_external_links(self, content: str) -> int:
         """Count external links in content"""
-        import re
-        return len(re.findall(r'\[.+\]\(https?:\/\/[^)]+\)', content))
+        return len(_EXTERNAL_LINK_RE.findall(content))
     
     def _count_images(self, content: str) -> int:
         """Count images in content"""
-        import re
-        return len(re.findall(r'!\[.*\]\([^)]+\)', content))
+        return len(_IMAGE_RE.findall(content))
     
-    def _calculate_basic_seo_score(self, metadata: Dict, content: str) -> float:
-        """Calculate basic SEO score"""
+    def _calculate_basic_seo_score(self, metadata: Dict, content: str, *,
+                                   headings: Optional[Dict] = None,
+                                   image_count: Optional[int] = None,
+                                   internal_links: Optional[int] = None) -> float:
+        """Calculate basic SEO score
+        
+        Precomputed heading/image/link counts may be passed in to avoid
+        re-scanning the content.
+        """
         score = 0.0
         
         # Title exists and appropriate length
@@ -587,97 +1147,27 @@ class FirecrawlMCP:
             score += 1.0
         
         # Headings structure
-        headings = self._extract_headings(content)
+        if headings is None:
+            headings = self._extract_headings(content)
         if headings["h1"] >= 1:
             score += 1.0
         if headings["h2"] >= 2:
             score += 1.0
         
         # Images
-        if self._count_images(content) > 0:
+        if image_count is None:
+            image_count = self._count_images(content)
+        if image_count > 0:
             score += 1.0
         
         # Internal links
-        if self._count_internal_links(content) >= 3:
+        if internal_links is None:
+            internal_links = self._count_internal_links(content)
+        if internal_links >= 3:
             score += 1.0
         
         return min(score, 10.0)  # Cap at 10
     
-    def _categorize_pages(self, pages: List[Dict]) -> Dict:
-        """Categorize pages by type"""
-        categories = {
-            "homepage": 0,
-            "services": 0,
-            "about": 0,
-            "contact": 0,
-            "blog": 0,
-            "other": 0
-        }
-        
-        for page in pages:
-            url = page.get("url", "").lower()
-            if url.endswith("/") or url.split("/")[-1] in ["", "index.html", "index.php"]:
-                categories["homepage"] += 1
-            elif "service" in url:
-                categories["services"] += 1
-            elif "about" in url:
-                categories["about"] += 1
-            elif "contact" in url:
-                categories["contact"] += 1
-            elif "blog" in url or "news" in url or "article" in url:
-                categories["blog"] += 1
-            else:
-                categories["other"] += 1
-        
-        return categories
-    
-    def _analyze_url_patterns(self, pages: List[Dict]) -> Dict:
-        """Analyze URL structure patterns"""
-        urls = [page.get("url", "") for page in pages]
-        
-        patterns = {
-            "avg_url_length": sum(len(url) for url in urls) / len(urls) if urls else 0,
-            "uses_hyphens": sum(1 for url in urls if "-" in url) / len(urls) if urls else 0,
-            "uses_underscores": sum(1 for url in urls if "_" in url) / len(urls) if urls else 0,
-            "max_depth": max(url.count("/") - 2 for url in urls if url.startswith("http")) if urls else 0
-        }
-        
-        return patterns
-    
-    def _analyze_content_distribution(self, pages: List[Dict]) -> Dict:
-        """Analyze content distribution across pages"""
-        content_lengths = [len(page.get("content", "")) for page in pages]
-        
-        if not content_lengths:
-            return {"error": "No content found"}
-        
-        distribution = {
-            "avg_content_length": sum(content_lengths) / len(content_lengths),
-            "min_content_length": min(content_lengths),
-            "max_content_length": max(content_lengths),
-            "pages_with_substantial_content": sum(1 for length in content_lengths if length > 1000)
-        }
-        
-        return distribution
-    
-    def _extract_technical_insights(self, pages: List[Dict]) -> Dict:
-        """Extract technical SEO insights"""
-        insights = {
-            "total_pages_crawled": len(pages),
-            "pages_with_meta_description": 0,
-            "pages_with_proper_titles": 0,
-            "average_load_time": 0  # Would need actual timing data
-        }
-        
-        for page in pages:
-            metadata = page.get("metadata", {})
-            if metadata.get("description"):
-                insights["pages_with_meta_description"] += 1
-            if metadata.get("title") and 30 <= len(metadata["title"]) <= 60:
-                insights["pages_with_proper_titles"] += 1
-        
-        return insights
-    
     def _find_common_keywords(self, results: List[Dict]) -> List[str]:
         """Find common keywords across competitors"""
         # Simple implementation - would use more sophisticated NLP in production
@@ -689,7 +1179,6 @@ class FirecrawlMCP:
                 all_keywords.extend(keywords.split(","))
         
         # Count frequency and return most common
-        from collections import Counter
         keyword_counts = Counter(k.strip().lower() for k in all_keywords if k.strip())
         return [k for k, count in keyword_counts.most_common(10)]
     
@@ -747,9 +1236,9 @@ class FirecrawlMCP:
         gaps = []
         
         # Analyze common weaknesses
-        low_seo_scores = [r for r in results if r.get("seo_analysis", {}).get("seo_score", 0) < 7]
+        low_count = sum(1 for r in results if r.get("seo_analysis", {}).get("seo_score", 0) < 7)
         
-        if len(low_seo_scores) > len(results) * 0.5:
+        if low_count > len(results) * 0.5:
             gaps.append("Most competitors have suboptimal SEO - opportunity for better optimization")
         
         # Check for missing content types
@@ -763,131 +1252,15 @@ class FirecrawlMCP:
 # COMBINED MCP ORCHESTRATOR
 # =============================================================================
 
-class GitHubFirecrawlOrchestrator:
-    """Combined orchestrator for GitHub and Firecrawl operations"""
-    
-    def __init__(self):
-        self.github = GitHubMCP()
-        self.firecrawl = FirecrawlMCP()
-        self.initialized = False
-    
-    async def initialize(self):
-        """Initialize both MCP connections"""
-        try:
-            await self.github.initialize()
-            await self.firecrawl.initialize()
-            self.initialized = True
-            logger.info("GitHub & Firecrawl MCP orchestrator initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize MCP orchestrator: {e}")
-            raise
-    
-    async def full_competitive_analysis_and_deployment(self, site_data: Dict, competitor_urls: List[str]) -> Dict:
-        """Complete workflow: analyze competitors and deploy to GitHub"""
-        if not self.initialized:
-            await self.initialize()
-        
-        workflow_results = {
-            "started_at": datetime.utcnow().isoformat(),
-            "site_data": site_data,
-            "steps_completed": [],
-            "errors": []
-        }
-        
-        try:
-            # Step 1: Analyze competitors
-            logger.info("Starting competitive analysis...")
-            competitor_analysis = await self.firecrawl.batch_competitor_analysis(competitor_urls)
-            
-            if competitor_analysis["success"]:
-                workflow_results["steps_completed"].append("competitive_analysis")
-                workflow_results["competitor_analysis"] = competitor_analysis
-            else:
-                workflow_results["errors"].append("Failed to analyze competitors")
-            
-            # Step 2: Create GitHub repository
-            logger.info("Creating GitHub repository...")
-            repo_result = await self.github.create_seo_website_repo(site_data)
-            
-            if repo_result["success"]:
-                workflow_results["steps_completed"].append("github_repo_created")
-                workflow_results["repository"] = repo_result
-                repo_name = repo_result["repo_name"]
-            else:
-                workflow_results["errors"].append(f"Failed to create repository: {repo_result['error']}")
-                return workflow_results
-            
-            # Step 3: Generate and commit website files
-            logger.info("Generating and committing website files...")
-            website_files = self._generate_website_files_from_analysis(
-                site_data, 
-                competitor_analysis.get("competitive_intelligence", {})
-            )
-            
-            commit_result = await self.github.commit_website_files(repo_name, website_files)
-            
-            if commit_result["success"]:
-                workflow_results["steps_completed"].append("website_files_committed")
-                workflow_results["commit_result"] = commit_result
-            else:
-                workflow_results["errors"].append(f"Failed to commit files: {commit_result['error']}")
-            
-            # Step 4: Setup GitHub Pages
-            logger.info("Setting up GitHub Pages...")
-            pages_result = await self.github.setup_github_pages(repo_name)
-            
-            if pages_result["success"]:
-                workflow_results["steps_completed"].append("github_pages_enabled")
-                workflow_results["pages_result"] = pages_result
-            else:
-                workflow_results["errors"].append(f"Failed to setup GitHub Pages: {pages_result['error']}")
-            
-            # Step 5: Create deployment workflow
-            logger.info("Creating deployment workflow...")
-            workflow_result = await self.github.create_deployment_workflow(
-                repo_name, 
-                {"platform": "netlify"}
-            )
-            
-            if workflow_result["success"]:
-                workflow_results["steps_completed"].append("deployment_workflow_created")
-                workflow_results["workflow_result"] = workflow_result
-            else:
-                workflow_results["errors"].append(f"Failed to create workflow: {workflow_result['error']}")
-            
-            # Final summary
-            workflow_results["completed_at"] = datetime.utcnow().isoformat()
-            workflow_results["success"] = len(workflow_results["errors"]) == 0
-            workflow_results["summary"] = {
-                "repository_url": repo_result.get("repo_url"),
-                "pages_url": pages_result.get("pages_url"),
-                "competitors_analyzed": competitor_analysis.get("successful_analyses", 0),
-                "files_committed": commit_result.get("total_files", 0)
-            }
-            
-            return workflow_results
-            
-        except Exception as e:
-            logger.error(f"Workflow failed: {e}")
-            workflow_results["errors"].append(f"Workflow error: {str(e)}")
-            workflow_results["success"] = False
-            return workflow_results
-    
-    def _generate_website_files_from_analysis(self, site_data: Dict, competitive_intel: Dict) -> Dict[str, str]:
-        """Generate website files based on competitive analysis"""
-        
-        service = site_data.get("service", "Business")
-        location = site_data.get("location", "Local Area")
-        
-        # Basic website structure based on analysis
-        files = {
-            "index.html": f"""<!DOCTYPE html>
+# Generated website templates. The stylesheet and script are static; the
+# page template is filled with str.format_map.
+_INDEX_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{service} in {location} - Professional Services</title>
-    <meta name="description" content="Professional {service.lower()} services in {location}. Licensed, insured, and available 24/7 for all your needs.">
+    <meta name="description" content="Professional {service_lower} services in {location}. Licensed, insured, and available 24/7 for all your needs.">
     <link rel="stylesheet" href="styles.css">
 </head>
 <body>
@@ -907,7 +1280,7 @@ class GitHubFirecrawlOrchestrator:
     <main>
         <section class="hero">
             <h1>Professional {service} in {location}</h1>
-            <p>Licensed, insured, and available 24/7 for all your {service.lower()} needs.</p>
+            <p>Licensed, insured, and available 24/7 for all your {service_lower} needs.</p>
             <a href="#contact" class="cta-button">Get Free Quote</a>
         </section>
         
@@ -916,15 +1289,15 @@ class GitHubFirecrawlOrchestrator:
             <div class="services-grid">
                 <div class="service-card">
                     <h3>Emergency Service</h3>
-                    <p>24/7 emergency {service.lower()} available</p>
+                    <p>24/7 emergency {service_lower} available</p>
                 </div>
                 <div class="service-card">
                     <h3>Residential</h3>
-                    <p>Complete {service.lower()} for homeowners</p>
+                    <p>Complete {service_lower} for homeowners</p>
                 </div>
                 <div class="service-card">
                     <h3>Commercial</h3>
-                    <p>Professional {service.lower()} for businesses</p>
+                    <p>Professional {service_lower} for businesses</p>
                 </div>
             </div>
         </section>
@@ -952,9 +1325,9 @@ class GitHubFirecrawlOrchestrator:
     
     <script src="script.js"></script>
 </body>
-</html>""",
-            
-            "styles.css": """/* Modern CSS for SEO website */
+</html>"""
+
+_STATIC_CSS = """/* Modern CSS for SEO website */
 * {
     margin: 0;
     padding: 0;
@@ -1089,9 +1462,9 @@ footer {
     nav ul {
         gap: 1rem;
     }
-}""",
-            
-            "script.js": """// Modern JavaScript for SEO website
+}"""
+
+_STATIC_JS = """// Modern JavaScript for SEO website
 document.addEventListener('DOMContentLoaded', function() {
     // Smooth scrolling for navigation links
     document.querySelectorAll('a[href^="#"]').forEach(anchor => {
@@ -1137,25 +1510,87 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         });
     });
-});""",
-            
-            "package.json": json.dumps({
-                "name": f"seo-{service.lower().replace(' ', '-')}-{location.lower().replace(' ', '-').replace(',', '')}",
-                "version": "1.0.0",
-                "description": f"SEO optimized website for {service} in {location}",
-                "scripts": {
-                    "build": "echo 'Build process - add your build commands here'",
-                    "start": "echo 'Start server - add your server start command here'",
-                    "deploy": "echo 'Deploy process - configured via GitHub Actions'"
-                },
-                "keywords": ["seo", "website", service.lower().replace(" ", "-"), "local-business"],
-                "author": "SEO Agent System",
-                "license": "MIT"
-            }, indent=2),
-            
-            "README.md": f"""# {service} - {location}
+});"""
+
+# Static files are encoded once; generated files are uploaded as bytes
+_STATIC_CSS_BYTES = _STATIC_CSS.encode("utf-8")
+_STATIC_JS_BYTES = _STATIC_JS.encode("utf-8")
 
-SEO optimized website for {service} serving {location}.
+async def _run_steps(*coros) -> List[Any]:
+    """Run independent workflow steps concurrently.
+
+    Uses asyncio.TaskGroup (3.11+) so a step that raises cancels its siblings
+    promptly; falls back to gather() on older interpreters. Either way each
+    slot holds the step's result or the exception that ended it.
+    """
+    if not hasattr(asyncio, "TaskGroup"):
+        return await asyncio.gather(*coros, return_exceptions=True)
+    
+    tasks = []
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except Exception:
+        pass  # ExceptionGroup; per-task outcomes are collected below
+    
+    results = []
+    for task in tasks:
+        if task.cancelled():
+            results.append(RuntimeError("cancelled after a sibling step failed"))
+        else:
+            results.append(task.exception() or task.result())
+    return results
+
+class _StepFailed(Exception):
+    """Raised to abort sibling steps when a required step reports failure"""
+    
+    def __init__(self, result: Dict):
+        super().__init__(result.get("error", "step failed"))
+        self.result = result
+
+async def _contained(coro, step: str) -> Dict:
+    """Await a step whose errors must not cancel its siblings, turning an exception into a failure result"""
+    try:
+        return await coro
+    except Exception as e:
+        logger.error(f"{step} failed: {e}")
+        return {"success": False, "error": str(e)}
+
+async def _require_success(coro) -> Dict:
+    """Await a step and raise _StepFailed if it returned success=False"""
+    result = await coro
+    if not result.get("success"):
+        raise _StepFailed(result)
+    return result
+
+@dataclass(slots=True)
+class WorkflowResult:
+    """Outcome of a full competitive analysis and deployment workflow"""
+    started_at: str
+    site_data: Dict
+    steps_completed: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    success: bool = False
+    competitor_analysis: Optional[Dict] = None
+    repository: Optional[Dict] = None
+    commit_result: Optional[Dict] = None
+    pages_result: Optional[Dict] = None
+    workflow_result: Optional[Dict] = None
+    completed_at: Optional[str] = None
+    duration_ms: Optional[int] = None
+    summary: Optional[Dict] = None
+    
+    def to_dict(self) -> Dict:
+        """Plain dict for callers, leaving out steps that never ran"""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        }
+
+# Static parts of README.md; only the service, location, competitor counts and
+# generation timestamp vary per site.
+_README_HEAD = """SEO optimized website for {service} serving {location}.
 
 ## Features
 
@@ -1172,9 +1607,9 @@ This website was automatically generated using competitive analysis and SEO best
 
 ### Competitive Analysis Results
 
-- Competitors analyzed: {competitive_intel.get('competitors_analyzed', 'N/A')}
-- Opportunities identified: {len(competitive_intel.get('opportunity_gaps', []))}
-- Technical optimizations applied: Based on competitor weaknesses
+"""
+
+_README_TAIL = """- Technical optimizations applied: Based on competitor weaknesses
 
 ## Deployment
 
@@ -1203,9 +1638,226 @@ python -m http.server 8000
 
 ---
 
-Generated on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
 """
-        }
+
+@lru_cache(maxsize=128)
+def _package_json(service: str, location: str) -> str:
+    """Serialized package.json for a generated website"""
+    service_slug = service.lower().replace(" ", "-")
+    location_slug = location.lower().replace(" ", "-").replace(",", "")
+    
+    return _json_bytes({
+        "name": f"seo-{service_slug}-{location_slug}",
+        "version": "1.0.0",
+        "description": f"SEO optimized website for {service} in {location}",
+        "scripts": {
+            "build": "echo 'Build process - add your build commands here'",
+            "start": "echo 'Start server - add your server start command here'",
+            "deploy": "echo 'Deploy process - configured via GitHub Actions'"
+        },
+        "keywords": ["seo", "website", service_slug, "local-business"],
+        "author": "SEO Agent System",
+        "license": "MIT"
+    }, indent=True).decode("utf-8")
+
+class GitHubFirecrawlOrchestrator:
+    """Combined orchestrator for GitHub and Firecrawl operations"""
+    
+    # Most generated file sets kept for repeat deployments of the same niche
+    FILES_CACHE_SIZE = 32
+    
+    def __init__(self):
+        self.github = GitHubMCP()
+        self.firecrawl = FirecrawlMCP()
+        self.initialized = False
+        self._files_cache: "OrderedDict[str, Tuple[Tuple[str, bytes], ...]]" = OrderedDict()
+    
+    async def initialize(self):
+        """Initialize the GitHub MCP connection
+        
+        Firecrawl is initialized lazily by the first scrape that needs the MCP
+        server, so GitHub-only workflows and small direct scrapes never start it.
+        """
+        try:
+            await self._ensure("github")
+            self.initialized = True
+            logger.info("GitHub & Firecrawl MCP orchestrator initialized")
+        except Exception as e:
+            logger.error(f"Failed to initialize MCP orchestrator: {e}")
+            raise
+    
+    async def _ensure(self, which: str):
+        """Initialize one MCP client ("github" or "firecrawl") if needed"""
+        client = getattr(self, which)
+        if not client.initialized:
+            await client.initialize()
+    
+    async def close(self):
+        """Release the GitHub and Firecrawl connections"""
+        await self.github.close()
+        await self.firecrawl.aclose()
+        self.initialized = False
+    
+    async def full_competitive_analysis_and_deployment(self, site_data: Dict, competitor_urls: List[str]) -> Dict:
+        """Complete workflow: analyze competitors and deploy to GitHub"""
+        if not self.initialized:
+            await self.initialize()
+        
+        start_ns = time.monotonic_ns()
+        result = WorkflowResult(started_at=datetime.utcnow().isoformat(), site_data=site_data)
+        
+        try:
+            # Steps 1 & 2: Analyze competitors and create the GitHub repository.
+            # They are independent, so run them concurrently. Without a repo the
+            # workflow is doomed, so a failed creation cancels any scrape still
+            # in flight rather than letting it spend Firecrawl quota. Scrape
+            # errors are contained, so they never cancel a repo creation that
+            # may already have happened on GitHub.
+            competitor_analysis, repo_result = await _run_steps(
+                _contained(self.firecrawl.batch_competitor_analysis(competitor_urls), "Competitive analysis"),
+                _require_success(self.github.create_seo_website_repo(site_data))
+            )
+            
+            if isinstance(competitor_analysis, Exception):  # cancelled by a failed repo creation
+                competitor_analysis = {"success": False, "error": str(competitor_analysis)}
+            if isinstance(repo_result, _StepFailed):
+                repo_result = repo_result.result
+            elif isinstance(repo_result, Exception):
+                logger.error(f"Repository creation failed: {repo_result}")
+                repo_result = {"success": False, "error": str(repo_result)}
+            
+            if competitor_analysis["success"]:
+                result.steps_completed.append("competitive_analysis")
+                result.competitor_analysis = competitor_analysis
+            else:
+                result.errors.append("Failed to analyze competitors")
+            
+            if repo_result["success"]:
+                result.steps_completed.append("github_repo_created")
+                result.repository = repo_result
+                repo_name = repo_result["repo_name"]
+            else:
+                result.errors.append(f"Failed to create repository: {repo_result['error']}")
+                result.duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+                logger.info("Workflow stopped: completed=%s errors=%s", result.steps_completed, result.errors)
+                return result.to_dict()
+            
+            # Step 3: Generate and commit website files
+            website_files = self._generate_website_files_from_analysis(
+                site_data, 
+                competitor_analysis.get("competitive_intelligence", {})
+            )
+            
+            commit_result = await self.github.commit_website_files(repo_name, website_files)
+            
+            if commit_result["success"]:
+                result.steps_completed.append("website_files_committed")
+                result.commit_result = commit_result
+            else:
+                result.errors.append(f"Failed to commit files: {commit_result['error']}")
+            
+            # Steps 4 & 5: Setup GitHub Pages and create the deployment workflow.
+            # Both only need the repository, so run them concurrently. Each is a
+            # GitHub write, so neither one's error may cancel the other midway.
+            pages_result, workflow_result = await _run_steps(
+                _contained(self.github.setup_github_pages(repo_name), "GitHub Pages setup"),
+                _contained(self.github.create_deployment_workflow(repo_name, {"platform": "netlify"}),
+                           "Deployment workflow creation")
+            )
+            
+            if pages_result["success"]:
+                result.steps_completed.append("github_pages_enabled")
+                result.pages_result = pages_result
+            else:
+                result.errors.append(f"Failed to setup GitHub Pages: {pages_result['error']}")
+            
+            if workflow_result["success"]:
+                result.steps_completed.append("deployment_workflow_created")
+                result.workflow_result = workflow_result
+            else:
+                result.errors.append(f"Failed to create workflow: {workflow_result['error']}")
+            
+            # Final summary
+            result.completed_at = datetime.utcnow().isoformat()
+            result.duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            result.success = not result.errors
+            result.summary = {
+                "repository_url": repo_result.get("repo_url"),
+                "pages_url": pages_result.get("pages_url"),
+                "competitors_analyzed": competitor_analysis.get("successful_analyses", 0),
+                "files_committed": commit_result.get("total_files", 0)
+            }
+            
+            # One log record per workflow instead of one per step
+            logger.info("Workflow complete: completed=%s errors=%s", result.steps_completed, result.errors)
+            
+            return result.to_dict()
+            
+        except Exception as e:
+            logger.error(f"Workflow failed: {e}")
+            result.errors.append(f"Workflow error: {str(e)}")
+            result.success = False
+            result.duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            return result.to_dict()
+    
+    def _generate_website_files_from_analysis(self, site_data: Dict, competitive_intel: Dict) -> List[Tuple[str, bytes]]:
+        """Generate website files based on competitive analysis
+        
+        Results are memoized per (service, location, competitive intel) in a
+        small LRU cache.
+        """
+        
+        service = site_data.get("service", "Business")
+        location = site_data.get("location", "Local Area")
+        
+        intel_hash = hashlib.blake2b(
+            json.dumps(competitive_intel, sort_keys=True, default=str).encode(),
+            digest_size=8
+        ).hexdigest()
+        cache_key = f"{service}::{location}::{intel_hash}"
+        
+        cached = self._files_cache.get(cache_key)
+        if cached is not None:
+            self._files_cache.move_to_end(cache_key)
+            return list(cached)
+        
+        files = self._build_website_files(service, location, competitive_intel)
+        
+        self._files_cache[cache_key] = tuple(files)
+        if len(self._files_cache) > self.FILES_CACHE_SIZE:
+            self._files_cache.popitem(last=False)
+        
+        return files
+    
+    def _build_website_files(self, service: str, location: str, competitive_intel: Dict) -> List[Tuple[str, bytes]]:
+        """Build the website files for a service and location as (path, UTF-8 bytes) pairs"""
+        
+        service_lower = service.lower()
+        now_str = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+        
+        # Basic website structure based on analysis
+        files = [
+            ("index.html", _INDEX_HTML_TEMPLATE.format_map({
+                "service": service,
+                "location": location,
+                "service_lower": service_lower
+            }).encode("utf-8")),
+            
+            ("styles.css", _STATIC_CSS_BYTES),
+            
+            ("script.js", _STATIC_JS_BYTES),
+            
+            ("package.json", _package_json(service, location).encode("utf-8")),
+            
+            ("README.md", "".join((
+                f"# {service} - {location}\n\n",
+                _README_HEAD.format(service=service, location=location),
+                f"- Competitors analyzed: {competitive_intel.get('competitors_analyzed', 'N/A')}\n",
+                f"- Opportunities identified: {len(competitive_intel.get('opportunity_gaps', []))}\n",
+                _README_TAIL,
+                f"Generated on {now_str}\n"
+            )).encode("utf-8"))
+        ]
         
         return files
 
@@ -1223,22 +1875,26 @@ async def install_mcp_servers():
         "@mendableai/firecrawl-mcp-server"
     ]
     
-    for server in servers:
-        try:
-            print(f"Installing {server}...")
-            result = subprocess.run(
-                ["npm", "install", "-g", server],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
+    # npm resolves all packages in one invocation
+    try:
+        print(f"Installing {', '.join(servers)}...")
+        result = subprocess.run(
+            ["npm", "install", "-g", *servers],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode == 0:
+            for server in servers:
                 print(f"✅ {server} installed successfully")
-            else:
-                print(f"❌ Failed to install {server}: {result.stderr}")
-                
-        except Exception as e:
-            print(f"❌ Error installing {server}: {e}")
+        else:
+            failed = [server for server in servers if server in result.stderr] or servers
+            for server in failed:
+                print(f"❌ Failed to install {server}")
+            print(result.stderr)
+            
+    except Exception as e:
+        print(f"❌ Error installing MCP servers: {e}")
 
 def setup_environment_variables():
     """Setup guide for environment variables"""
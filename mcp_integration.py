@@ -9,16 +9,85 @@ import asyncio
 import json
 import logging
 import os
+import random
 import subprocess
+import time
+import weakref
+import aiohttp
 import docker
 import git
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
+from collections import OrderedDict, deque
 from datetime import datetime
+from functools import cached_property
+from string import Template
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+GITHUB_RETRY_STATUSES = {500, 502, 503, 504}
+GITHUB_RETRY_ATTEMPTS = 3
+GITHUB_RETRY_MAX_DELAY = 30.0
+GITHUB_ETAG_CACHE_SIZE = 256
+
+BUILD_LOG_TAIL_LINES = 200
+
+SHALLOW_CLONE_OPTIONS = ['--depth=1', '--single-branch', '--filter=blob:none', '--no-tags']
+
+def _write_text(path: str, content: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def _atomic_write_json(path: str, obj: Any) -> None:
+    """Write obj as indented JSON via a temp file and os.replace, so readers never see a partial file"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+async def _write_file(path: str, content: str) -> None:
+    """Write one text file without blocking the event loop"""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+            await f.write(content)
+    else:
+        await asyncio.to_thread(_write_text, path, content)
+
+async def _write_files(base_path: str, files: Dict[str, str]) -> None:
+    """Write files relative to base_path concurrently, creating each directory once"""
+    full_paths = {file_path: os.path.join(base_path, file_path) for file_path in files}
+    for directory in {os.path.dirname(full_path) for full_path in full_paths.values()}:
+        os.makedirs(directory, exist_ok=True)
+    
+    await asyncio.gather(*[
+        _write_file(full_paths[file_path], content)
+        for file_path, content in files.items()
+    ])
+
 @dataclass
 class MCPConfig:
     """Configuration for MCP integrations"""
@@ -27,13 +96,151 @@ class MCPConfig:
     filesystem_path: Optional[str] = None
     auto_deploy: bool = False
     deployment_platform: str = "digital_ocean"  # digital_ocean, aws, netlify, vercel
+    network_concurrency: int = 8  # concurrent GitHub calls/pushes across all pipelines
+
+class _OrchestratorPool:
+    """Process-wide caps on network work shared by every pipeline
+    
+    Semaphores are created per event loop on first use; the first caller's
+    limit for a kind applies to all later callers on that loop.
+    """
+    
+    _semaphores = weakref.WeakKeyDictionary()  # event loop -> {kind: Semaphore}
+    
+    @classmethod
+    def semaphore(cls, kind: str, limit: int) -> asyncio.Semaphore:
+        per_loop = cls._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if kind not in per_loop:
+            per_loop[kind] = asyncio.Semaphore(limit)
+        return per_loop[kind]
     
 class GitHubIntegration:
     """Handles GitHub repository operations"""
     
     def __init__(self, token: Optional[str] = None):
-        self.token = token or os.getenv('GITHUB_TOKEN')
+        # Several comma-separated tokens (e.g. GITHUB_TOKENS) spread calls across rate limits
+        tokens = token or os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN') or ''
+        self._tokens = [t.strip() for t in tokens.split(',') if t.strip()]
+        self._token_reset_at = {t: 0.0 for t in self._tokens}
+        self._token_last_used = {t: 0.0 for t in self._tokens}
+        self.token = self._tokens[0] if self._tokens else None
         self.base_url = "https://api.github.com"
+        # (token, path) -> (etag, body) for conditional GETs; in memory, so bodies never touch disk
+        self._etag_cache = OrderedDict()
+        self._login = None
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self):
+        """Shared aiohttp session, created on first use so the pool and TLS connections are reused"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'Accept': 'application/vnd.github.v3+json'},
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _pick_token(self) -> str:
+        """Least recently used token that is not rate limited (or the one that resets soonest)"""
+        now = time.time()
+        available = [t for t in self._tokens if self._token_reset_at[t] <= now]
+        if available:
+            token = min(available, key=self._token_last_used.__getitem__)
+        else:
+            token = min(self._tokens, key=self._token_reset_at.__getitem__)
+        self._token_last_used[token] = time.monotonic()
+        return token
+    
+    def _record_rate_limit(self, token: str, headers) -> bool:
+        """Remember when an exhausted token resets; returns True if it is exhausted"""
+        if headers.get('X-RateLimit-Remaining') != '0':
+            return False
+        try:
+            self._token_reset_at[token] = float(headers.get('X-RateLimit-Reset', 0))
+        except ValueError:
+            self._token_reset_at[token] = time.time() + 60
+        return True
+    
+    async def _request(self, method: str, path: str, pin_token: bool = False, **kwargs):
+        """Call the GitHub API and return (status, json)
+        
+        Transient failures are retried with jittered exponential backoff, and
+        GETs are made conditional on the cached ETag so unchanged resources
+        cost a 304. Read-only GETs rotate across the token pool, swapping a
+        rate-limited token for the next one. Writes, and GETs with pin_token
+        (anything that depends on which account is asking), always use the
+        primary token, since pooled tokens may belong to different accounts.
+        """
+        session = self._get_session()
+        rotate = method == 'GET' and not pin_token
+        token_switches = 0
+        attempt = 0
+        
+        while True:
+            token = self._pick_token() if rotate else self.token
+            headers = {'Authorization': f'token {token}'}
+            cached = self._etag_get(token, path) if method == 'GET' else None
+            if cached:
+                headers['If-None-Match'] = cached[0]
+            
+            try:
+                async with session.request(method, f"{self.base_url}{path}", headers=headers, **kwargs) as response:
+                    if response.status == 304 and cached:
+                        return 200, cached[1]
+                    
+                    exhausted = self._record_rate_limit(token, response.headers)
+                    
+                    if (rotate and response.status in (403, 429) and exhausted
+                            and token_switches < len(self._tokens) - 1):
+                        logger.warning("GitHub token rate limited, retrying with the next token")
+                        token_switches += 1
+                        continue
+                    
+                    # Only decode once we're keeping the response; outage pages are often HTML
+                    if response.status not in GITHUB_RETRY_STATUSES or attempt >= GITHUB_RETRY_ATTEMPTS - 1:
+                        body = await response.text()
+                        try:
+                            result = json.loads(body) if body else {}
+                        except ValueError:
+                            return response.status, {'message': body.strip()[:200]}
+                        
+                        if method == 'GET' and response.status == 200 and 'ETag' in response.headers:
+                            self._etag_put(token, path, response.headers['ETag'], body)
+                        return response.status, result
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt >= GITHUB_RETRY_ATTEMPTS - 1:
+                    raise
+            
+            delay = min(GITHUB_RETRY_MAX_DELAY, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning(f"GitHub {method} {path} failed, retrying in {delay:.1f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    def _etag_get(self, token: str, path: str) -> Optional[tuple]:
+        """Cached (etag, json) for a GET path made with token, if any"""
+        entry = self._etag_cache.get((token, path))
+        if entry is None:
+            return None
+        self._etag_cache.move_to_end((token, path))
+        return entry[0], json.loads(entry[1])
+    
+    def _etag_put(self, token: str, path: str, etag: str, body: str):
+        self._etag_cache[(token, path)] = (etag, body)
+        self._etag_cache.move_to_end((token, path))
+        if len(self._etag_cache) > GITHUB_ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
     
     async def create_repository(self, repo_name: str, description: str, private: bool = False) -> Dict[str, Any]:
         """Create a new GitHub repository"""
@@ -42,13 +249,6 @@ class GitHubIntegration:
             return {'success': False, 'error': 'GitHub token not provided'}
         
         try:
-            import aiohttp
-            
-            headers = {
-                'Authorization': f'token {self.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
             data = {
                 'name': repo_name,
                 'description': description,
@@ -57,39 +257,60 @@ class GitHubIntegration:
                 'gitignore_template': 'Python'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/user/repos",
-                    headers=headers,
-                    json=data
-                ) as response:
-                    result = await response.json()
-                    
-                    if response.status == 201:
-                        return {
-                            'success': True,
-                            'repo_url': result['html_url'],
-                            'clone_url': result['clone_url'],
-                            'ssh_url': result['ssh_url']
-                        }
-                    else:
-                        return {'success': False, 'error': result.get('message', 'Unknown error')}
-                        
+            status, result = await self._request('POST', '/user/repos', json=data)
+            
+            if status == 201:
+                return {
+                    'success': True,
+                    'repo_url': result['html_url'],
+                    'clone_url': result['clone_url'],
+                    'ssh_url': result['ssh_url']
+                }
+            
+            # Reruns find the repository already there; reuse it instead of failing on 422
+            if status == 422:
+                existing = await self._get_existing_repository(repo_name)
+                if existing:
+                    return {
+                        'success': True,
+                        'repo_url': existing['html_url'],
+                        'clone_url': existing['clone_url'],
+                        'ssh_url': existing['ssh_url'],
+                        'already_existed': True
+                    }
+            
+            return {'success': False, 'error': result.get('message', 'Unknown error')}
+            
         except Exception as e:
             logger.error(f"Error creating GitHub repository: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    async def _get_existing_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Metadata of the authenticated user's repo_name, or None if it doesn't exist"""
+        if self._login is None:
+            status, user = await self._request('GET', '/user', pin_token=True)
+            if status != 200:
+                return None
+            self._login = user['login']
+        
+        status, repo = await self._request('GET', f"/repos/{self._login}/{repo_name}", pin_token=True)
+        return repo if status == 200 else None
+    
     def clone_and_setup_local_repo(self, clone_url: str, local_path: str) -> Dict[str, Any]:
         """Clone repository and set up local development"""
         
         try:
-            # Clone the repository
-            repo = git.Repo.clone_from(clone_url, local_path)
+            # Clone only the tip of the default branch; we just need a working tree to push from
+            try:
+                repo = git.Repo.clone_from(clone_url, local_path, multi_options=SHALLOW_CLONE_OPTIONS)
+            except git.GitCommandError:
+                # Empty repositories can't be cloned shallowly
+                logger.info(f"Shallow clone of {clone_url} failed, falling back to a full clone")
+                repo = git.Repo.clone_from(clone_url, local_path)
             
             # Set up basic structure
-            os.makedirs(os.path.join(local_path, 'src'), exist_ok=True)
-            os.makedirs(os.path.join(local_path, 'assets'), exist_ok=True)
-            os.makedirs(os.path.join(local_path, 'docs'), exist_ok=True)
+            for directory in ('src', 'assets', 'docs'):
+                os.makedirs(os.path.join(local_path, directory), exist_ok=True)
             
             return {
                 'success': True,
@@ -101,57 +322,87 @@ class GitHubIntegration:
             logger.error(f"Error setting up local repository: {str(e)}")
             return {'success': False, 'error': str(e)}
     
-    def commit_and_push_website(self, repo_path: str, website_files: Dict[str, str], commit_message: str) -> Dict[str, Any]:
-        """Commit website files and push to GitHub"""
+    async def commit_and_push_website(self, repo_path: str, website_files: Dict[str, str], commit_message: str,
+                                      extra_paths: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Commit website files and push to GitHub
+        
+        Only website_files and extra_paths (other generated files, relative to
+        repo_path) are staged, so the working tree is never rescanned.
+        """
         
         try:
-            repo = git.Repo(repo_path)
-            
             # Write website files
-            for file_path, content in website_files.items():
-                full_path = os.path.join(repo_path, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            
-            # Add all files
-            repo.git.add('.')
+            await _write_files(repo_path, website_files)
             
-            # Commit
-            repo.index.commit(commit_message)
+            paths = [Path(p).as_posix() for p in [*website_files, *(extra_paths or [])]]
             
-            # Push
-            origin = repo.remote('origin')
-            origin.push()
+            # GitPython is blocking, so commit and push off the event loop
+            commit_hash = await asyncio.to_thread(self._commit_and_push, repo_path, paths, commit_message)
             
             return {
                 'success': True,
-                'commit_hash': repo.head.commit.hexsha,
+                'commit_hash': commit_hash,
                 'message': 'Website committed and pushed successfully'
             }
             
         except Exception as e:
             logger.error(f"Error committing and pushing: {str(e)}")
             return {'success': False, 'error': str(e)}
-
-class DockerIntegration:
-    """Handles Docker containerization and deployment"""
     
-    def __init__(self):
-        try:
-            self.client = docker.from_env()
-            self.docker_available = True
-        except Exception as e:
-            logger.warning(f"Docker not available: {str(e)}")
-            self.docker_available = False
+    @staticmethod
+    def _commit_and_push(repo_path: str, paths: List[str], commit_message: str) -> str:
+        """Stage paths, commit and push; returns the new commit hash"""
+        if PYGIT2_AVAILABLE:
+            commit_hash = GitHubIntegration._commit_pygit2(repo_path, paths, commit_message)
+        else:
+            commit_hash = None
+        
+        if commit_hash is None:
+            repo = git.Repo(repo_path)
+            
+            # Stage just the files we wrote
+            repo.index.add(paths)
+            
+            # Commit
+            commit_hash = repo.index.commit(commit_message).hexsha
+        
+        # Push through the git binary so the usual credential helpers apply.
+        # GitHub speaks protocol v2, and threaded pack generation uses every core.
+        push = subprocess.run(
+            ['git', '-C', repo_path,
+             '-c', 'protocol.version=2',
+             '-c', f'pack.threads={os.cpu_count() or 1}',
+             'push', 'origin', 'HEAD'],
+            env={**os.environ, 'GIT_PROTOCOL': 'version=2'},
+            capture_output=True,
+            text=True
+        )
+        if push.returncode != 0:
+            raise RuntimeError(f"git push failed: {push.stderr.strip()}")
+        
+        return commit_hash
     
-    def create_dockerfile(self, website_path: str, framework: str = "static") -> str:
-        """Generate appropriate Dockerfile for the website"""
+    @staticmethod
+    def _commit_pygit2(repo_path: str, paths: List[str], commit_message: str) -> Optional[str]:
+        """Stage and commit in-process with libgit2; None if the repo has no usable identity"""
+        repo = pygit2.Repository(repo_path)
+        
+        try:
+            signature = repo.default_signature
+        except (KeyError, pygit2.GitError):
+            return None
         
-        if framework == "static":
-            dockerfile_content = """
-FROM nginx:alpine
+        for path in paths:
+            repo.index.add(path)
+        repo.index.write()
+        tree = repo.index.write_tree()
+        
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        return str(repo.create_commit('HEAD', signature, signature, commit_message, tree, parents))
+
+# Deployment file templates, rendered once at import time
+_DOCKERFILES = {
+    'static': """FROM nginx:alpine
 
 # Copy website files
 COPY . /usr/share/nginx/html
@@ -163,11 +414,8 @@ COPY nginx.conf /etc/nginx/nginx.conf 2>/dev/null || true
 EXPOSE 80
 
 # Start nginx
-CMD ["nginx", "-g", "daemon off;"]
-"""
-        elif framework == "node":
-            dockerfile_content = """
-FROM node:18-alpine
+CMD ["nginx", "-g", "daemon off;"]""",
+    'node': """FROM node:18-alpine
 
 # Set working directory
 WORKDIR /app
@@ -188,11 +436,8 @@ RUN npm run build
 EXPOSE 3000
 
 # Start the application
-CMD ["npm", "start"]
-"""
-        else:
-            dockerfile_content = """
-FROM python:3.11-slim
+CMD ["npm", "start"]""",
+    'python': """FROM python:3.11-slim
 
 # Set working directory
 WORKDIR /app
@@ -210,23 +455,13 @@ COPY . .
 EXPOSE 8000
 
 # Start the application
-CMD ["python", "app.py"]
-"""
-        
-        dockerfile_path = os.path.join(website_path, 'Dockerfile')
-        with open(dockerfile_path, 'w') as f:
-            f.write(dockerfile_content.strip())
-        
-        return dockerfile_path
-    
-    def create_docker_compose(self, website_path: str, service_name: str) -> str:
-        """Create docker-compose.yml for easy deployment"""
-        
-        compose_content = f"""
-version: '3.8'
+CMD ["python", "app.py"]"""
+}
+
+_DOCKER_COMPOSE_TEMPLATE = Template("""version: '3.8'
 
 services:
-  {service_name}:
+  ${service_name}:
     build: .
     ports:
       - "80:80"
@@ -247,18 +482,55 @@ services:
       - ./ssl:/etc/nginx/ssl
       - ./nginx-ssl.conf:/etc/nginx/nginx.conf
     depends_on:
-      - {service_name}
+      - ${service_name}
     networks:
       - web
 
 networks:
   web:
-    external: true
-"""
+    external: true""")
+
+class DockerIntegration:
+    """Handles Docker containerization and deployment"""
+    
+    def __init__(self):
+        # The daemon is only contacted once an image is actually built
+        self._docker_available = None
+    
+    @cached_property
+    def client(self):
+        return docker.from_env()
+    
+    @property
+    def docker_available(self) -> bool:
+        if self._docker_available is None:
+            try:
+                self.client
+                self._docker_available = True
+            except Exception as e:
+                logger.warning(f"Docker not available: {str(e)}")
+                self._docker_available = False
+        return self._docker_available
+    
+    def create_dockerfile(self, website_path: str, framework: str = "static") -> str:
+        """Generate appropriate Dockerfile for the website"""
+        
+        dockerfile_content = _DOCKERFILES.get(framework, _DOCKERFILES['python'])
+        
+        dockerfile_path = os.path.join(website_path, 'Dockerfile')
+        with open(dockerfile_path, 'w') as f:
+            f.write(dockerfile_content)
+        
+        return dockerfile_path
+    
+    def create_docker_compose(self, website_path: str, service_name: str) -> str:
+        """Create docker-compose.yml for easy deployment"""
+        
+        compose_content = _DOCKER_COMPOSE_TEMPLATE.substitute(service_name=service_name)
         
         compose_path = os.path.join(website_path, 'docker-compose.yml')
         with open(compose_path, 'w') as f:
-            f.write(compose_content.strip())
+            f.write(compose_content)
         
         return compose_path
     
@@ -276,18 +548,35 @@ networks:
                 rm=True
             )
             
+            # Full log goes to disk; only the tail is kept in memory for the result
+            log_path = os.path.join(website_path, 'logs', 'docker-build.log')
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            tail = deque(maxlen=BUILD_LOG_TAIL_LINES)
+            
+            with open(log_path, 'a', encoding='utf-8') as log_file:
+                for log in build_logs:
+                    line = log.get('stream')
+                    if line:
+                        log_file.write(line)
+                        tail.append(line)
+            
             result = {
                 'success': True,
                 'image_id': image.id,
                 'image_name': image_name,
-                'build_logs': [log.get('stream', '') for log in build_logs if 'stream' in log]
+                'build_logs_tail': ''.join(tail),
+                'build_log_path': log_path
             }
             
             # Push to registry if specified
             if registry:
-                push_logs = self.client.images.push(f"{registry}/{image_name}")
-                result['push_logs'] = push_logs
+                push_summary = self._push_image(f"{registry}/{image_name}")
+                result['push_logs'] = push_summary
                 result['registry_url'] = f"{registry}/{image_name}"
+                
+                if 'error' in push_summary:
+                    result['success'] = False
+                    result['error'] = push_summary['error']
             
             return result
             
@@ -295,6 +584,40 @@ networks:
             logger.error(f"Error building Docker image: {str(e)}")
             return {'success': False, 'error': str(e)}
 
+    def _push_image(self, repository: str) -> Dict[str, Any]:
+        """Push an image, keeping only the final status per layer instead of the full log"""
+        
+        layers = {}
+        summary = {}
+        
+        for line in self.client.images.push(repository, stream=True, decode=True):
+            if 'error' in line:
+                summary['error'] = line['error']
+            elif 'aux' in line:
+                summary['digest'] = line['aux'].get('Digest')
+            elif 'id' in line:
+                layers[line['id']] = line.get('status', '')
+            elif 'status' in line:
+                summary['status'] = line['status']
+        
+        summary['layers'] = layers
+        return summary
+
+_GITIGNORE = """node_modules/
+dist/
+build/
+*.log
+.env
+.DS_Store
+Thumbs.db"""
+
+# Asset directory (relative to the project) -> optimization applied to it
+_ASSET_OPTIMIZATIONS = (
+    ('assets/images', "Images compressed and optimized"),
+    ('src/styles', "CSS minified and optimized"),
+    ('src/scripts', "JavaScript minified and optimized"),
+)
+
 class FilesystemIntegration:
     """Handles advanced filesystem operations"""
     
@@ -328,15 +651,7 @@ class FilesystemIntegration:
             
             # Create basic configuration files
             config_files = {
-                '.gitignore': """
-node_modules/
-dist/
-build/
-*.log
-.env
-.DS_Store
-Thumbs.db
-""",
+                '.gitignore': _GITIGNORE,
                 'README.md': f"""
 # {project_name}
 
@@ -356,7 +671,7 @@ Generated by SEO Agent System
 ## Generated on
 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """,
-                'package.json': json.dumps({
+                'package.json': {
                     "name": project_name.lower().replace(' ', '-'),
                     "version": "1.0.0",
                     "description": f"SEO optimized website for {project_name}",
@@ -368,12 +683,16 @@ Generated by SEO Agent System
                     "keywords": ["seo", "website", "local-business"],
                     "author": "SEO Agent System",
                     "license": "MIT"
-                }, indent=2)
+                }
             }
             
             for file_name, content in config_files.items():
-                with open(os.path.join(project_path, file_name), 'w') as f:
-                    f.write(content.strip())
+                file_path = os.path.join(project_path, file_name)
+                if isinstance(content, dict):
+                    _atomic_write_json(file_path, content)
+                else:
+                    with open(file_path, 'w') as f:
+                        f.write(content.strip())
             
             return {
                 'success': True,
@@ -387,26 +706,24 @@ Generated by SEO Agent System
             return {'success': False, 'error': str(e)}
     
     @staticmethod
-    def optimize_assets(project_path: str) -> Dict[str, Any]:
-        """Optimize website assets for production"""
+    def optimize_assets(project_path: str, known_dirs: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Optimize website assets for production
+        
+        known_dirs is the directory list from create_project_structure; when
+        given, those directories are trusted to exist and the disk isn't probed.
+        """
         
         try:
-            optimizations = []
-            
-            # Image optimization (placeholder for actual implementation)
-            images_path = os.path.join(project_path, 'assets', 'images')
-            if os.path.exists(images_path):
-                optimizations.append("Images compressed and optimized")
-            
-            # CSS optimization
-            css_path = os.path.join(project_path, 'src', 'styles')
-            if os.path.exists(css_path):
-                optimizations.append("CSS minified and optimized")
+            if known_dirs is not None:
+                existing = set(known_dirs)
+            else:
+                existing = {
+                    directory for directory, _ in _ASSET_OPTIMIZATIONS
+                    if os.path.isdir(os.path.join(project_path, directory))
+                }
             
-            # JavaScript optimization
-            js_path = os.path.join(project_path, 'src', 'scripts')
-            if os.path.exists(js_path):
-                optimizations.append("JavaScript minified and optimized")
+            # Image, CSS and JavaScript optimization (placeholders for actual implementation)
+            optimizations = [message for directory, message in _ASSET_OPTIMIZATIONS if directory in existing]
             
             # Create optimization report
             optimization_report = {
@@ -422,8 +739,7 @@ Generated by SEO Agent System
             
             # Save report
             report_path = os.path.join(project_path, 'optimization-report.json')
-            with open(report_path, 'w') as f:
-                json.dump(optimization_report, f, indent=2)
+            _atomic_write_json(report_path, optimization_report)
             
             return {
                 'success': True,
@@ -435,6 +751,24 @@ Generated by SEO Agent System
             logger.error(f"Error optimizing assets: {str(e)}")
             return {'success': False, 'error': str(e)}
 
+_NETLIFY_TOML = """
+[build]
+  command = "npm run build"
+  publish = "dist"
+
+[[redirects]]
+  from = "/*"
+  to = "/index.html"
+  status = 200
+
+[[headers]]
+  for = "/*"
+  [headers.values]
+    Cache-Control = "public, max-age=31536000"
+    X-Frame-Options = "DENY"
+    X-Content-Type-Options = "nosniff"
+"""
+
 class DeploymentIntegration:
     """Handles deployment to various platforms"""
     
@@ -489,8 +823,7 @@ class DeploymentIntegration:
             spec_path = os.path.join(project_path, '.do', 'app.yaml')
             os.makedirs(os.path.dirname(spec_path), exist_ok=True)
             
-            with open(spec_path, 'w') as f:
-                json.dump(app_spec, f, indent=2)
+            _atomic_write_json(spec_path, app_spec)
             
             return {
                 'success': True,
@@ -511,52 +844,10 @@ class DeploymentIntegration:
         """Deploy to Netlify"""
         
         try:
-            # Create Netlify configuration
-            netlify_config = {
-                "build": {
-                    "command": "npm run build",
-                    "publish": "dist"
-                },
-                "redirects": [
-                    {
-                        "from": "/*",
-                        "to": "/index.html",
-                        "status": 200
-                    }
-                ],
-                "headers": [
-                    {
-                        "for": "/*",
-                        "values": {
-                            "Cache-Control": "public, max-age=31536000",
-                            "X-Frame-Options": "DENY",
-                            "X-Content-Type-Options": "nosniff"
-                        }
-                    }
-                ]
-            }
-            
             # Save netlify.toml
             config_path = os.path.join(project_path, 'netlify.toml')
             with open(config_path, 'w') as f:
-                # Convert to TOML format (simplified)
-                f.write(f"""
-[build]
-  command = "npm run build"
-  publish = "dist"
-
-[[redirects]]
-  from = "/*"
-  to = "/index.html"
-  status = 200
-
-[[headers]]
-  for = "/*"
-  [headers.values]
-    Cache-Control = "public, max-age=31536000"
-    X-Frame-Options = "DENY"
-    X-Content-Type-Options = "nosniff"
-""")
+                f.write(_NETLIFY_TOML)
             
             return {
                 'success': True,
@@ -598,8 +889,7 @@ class DeploymentIntegration:
             
             # Save vercel.json
             config_path = os.path.join(project_path, 'vercel.json')
-            with open(config_path, 'w') as f:
-                json.dump(vercel_config, f, indent=2)
+            _atomic_write_json(config_path, vercel_config)
             
             return {
                 'success': True,
@@ -627,6 +917,34 @@ class MCPOrchestrator:
         self.filesystem = FilesystemIntegration()
         self.deployment = DeploymentIntegration(config)
     
+    async def close(self):
+        """Release resources held by the integrations"""
+        await self.github.close()
+    
+    async def _limited(self, coro):
+        """Await coro while holding a shared network slot"""
+        async with _OrchestratorPool.semaphore('network', self.config.network_concurrency):
+            return await coro
+    
+    def _create_docker_config(self, project_path: str, project_name: str) -> Dict[str, Any]:
+        """Write the Dockerfile and docker-compose.yml for a project"""
+        return {
+            'success': True,
+            'dockerfile_path': self.docker.create_dockerfile(project_path, 'static'),
+            'docker_compose_path': self.docker.create_docker_compose(project_path, project_name)
+        }
+    
+    async def _create_deployment_config(self, project_path: str, project_name: str) -> Dict[str, Any]:
+        """Prepare deployment configuration for the configured platform"""
+        if self.config.deployment_platform == 'digital_ocean':
+            return await self.deployment.deploy_to_digital_ocean(project_path, project_name)
+        elif self.config.deployment_platform == 'netlify':
+            return await self.deployment.deploy_to_netlify(project_path, project_name)
+        elif self.config.deployment_platform == 'vercel':
+            return await self.deployment.deploy_to_vercel(project_path, project_name)
+        else:
+            return {'success': False, 'error': 'Unknown deployment platform'}
+    
     async def full_deployment_pipeline(self, website_data: Dict[str, Any], project_name: str) -> Dict[str, Any]:
         """Execute complete deployment pipeline"""
         
@@ -655,40 +973,76 @@ class MCPOrchestrator:
             # Step 2: Write website files
             logger.info("Writing website files...")
             website_files = website_data.get('generated_code', {})
-            for file_path, content in website_files.items():
-                full_path = os.path.join(project_path, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            await _write_files(project_path, website_files)
             pipeline_results['steps_completed'].append('website_files_written')
             
+            # Steps 3-6 only depend on the project path, so run them concurrently.
+            # The GitHub push waits for all of them so it commits a complete tree.
+            steps = {}
+            
             # Step 3: Optimize assets
             logger.info("Optimizing assets...")
-            opt_result = self.filesystem.optimize_assets(project_path)
-            if opt_result['success']:
-                pipeline_results['steps_completed'].append('assets_optimized')
-            else:
-                pipeline_results['errors'].append(f"Asset optimization: {opt_result['error']}")
+            steps['optimize'] = asyncio.to_thread(
+                self.filesystem.optimize_assets, project_path, fs_result['structure_created']
+            )
             
             # Step 4: Create GitHub repository (if token provided)
-            if self.config.github_token:
+            if self.github.token:
                 logger.info("Creating GitHub repository...")
-                repo_result = await self.github.create_repository(
+                steps['github'] = self._limited(self.github.create_repository(
                     project_name,
                     f"SEO optimized website for {project_name}",
                     private=False
-                )
+                ))
+            
+            # Step 5: Create Docker configuration (if enabled)
+            if self.config.docker_enabled:
+                logger.info("Creating Docker configuration...")
+                steps['docker'] = asyncio.to_thread(self._create_docker_config, project_path, project_name)
+            
+            # Step 6: Prepare deployment configuration
+            if self.config.auto_deploy:
+                logger.info(f"Preparing {self.config.deployment_platform} deployment...")
+                steps['deploy'] = self._create_deployment_config(project_path, project_name)
+            
+            gathered = await asyncio.gather(*steps.values(), return_exceptions=True)
+            results = {
+                name: {'success': False, 'error': str(result)} if isinstance(result, Exception) else result
+                for name, result in zip(steps, gathered)
+            }
+            
+            opt_result = results['optimize']
+            if opt_result['success']:
+                pipeline_results['steps_completed'].append('assets_optimized')
+            else:
+                pipeline_results['errors'].append(f"Asset optimization: {opt_result['error']}")
+            
+            # Everything the pipeline generated besides the website files, for staging
+            generated_paths = list(fs_result['config_files_created'])
+            if opt_result['success']:
+                generated_paths.append(opt_result['report_path'])
+            if results.get('docker', {}).get('success'):
+                generated_paths += [results['docker']['dockerfile_path'], results['docker']['docker_compose_path']]
+            if results.get('deploy', {}).get('success'):
+                generated_paths.append(results['deploy'].get('config_path') or results['deploy']['deployment_config'])
+            generated_paths = [
+                os.path.relpath(os.path.join(project_path, path), project_path) for path in generated_paths
+            ]
+            
+            if 'github' in results:
+                repo_result = results['github']
                 
                 if repo_result['success']:
                     pipeline_results['steps_completed'].append('github_repo_created')
                     pipeline_results['repository_url'] = repo_result['repo_url']
                     
                     # Push code to GitHub
-                    push_result = self.github.commit_and_push_website(
+                    push_result = await self._limited(self.github.commit_and_push_website(
                         project_path,
                         website_files,
-                        "Initial website generated by SEO Agent System"
-                    )
+                        "Initial website generated by SEO Agent System",
+                        extra_paths=generated_paths
+                    ))
                     
                     if push_result['success']:
                         pipeline_results['steps_completed'].append('code_pushed_to_github')
@@ -697,27 +1051,18 @@ class MCPOrchestrator:
                 else:
                     pipeline_results['errors'].append(f"GitHub repo creation: {repo_result['error']}")
             
-            # Step 5: Create Docker configuration (if enabled)
-            if self.config.docker_enabled:
-                logger.info("Creating Docker configuration...")
-                dockerfile_path = self.docker.create_dockerfile(project_path, 'static')
-                compose_path = self.docker.create_docker_compose(project_path, project_name)
-                pipeline_results['steps_completed'].append('docker_config_created')
-                pipeline_results['dockerfile_path'] = dockerfile_path
-                pipeline_results['docker_compose_path'] = compose_path
-            
-            # Step 6: Prepare deployment configuration
-            if self.config.auto_deploy:
-                logger.info(f"Preparing {self.config.deployment_platform} deployment...")
+            if 'docker' in results:
+                docker_result = results['docker']
                 
-                if self.config.deployment_platform == 'digital_ocean':
-                    deploy_result = await self.deployment.deploy_to_digital_ocean(project_path, project_name)
-                elif self.config.deployment_platform == 'netlify':
-                    deploy_result = await self.deployment.deploy_to_netlify(project_path, project_name)
-                elif self.config.deployment_platform == 'vercel':
-                    deploy_result = await self.deployment.deploy_to_vercel(project_path, project_name)
+                if docker_result['success']:
+                    pipeline_results['steps_completed'].append('docker_config_created')
+                    pipeline_results['dockerfile_path'] = docker_result['dockerfile_path']
+                    pipeline_results['docker_compose_path'] = docker_result['docker_compose_path']
                 else:
-                    deploy_result = {'success': False, 'error': 'Unknown deployment platform'}
+                    pipeline_results['errors'].append(f"Docker config: {docker_result['error']}")
+            
+            if 'deploy' in results:
+                deploy_result = results['deploy']
                 
                 if deploy_result['success']:
                     pipeline_results['steps_completed'].append('deployment_config_created')
@@ -754,10 +1099,13 @@ async def integrate_with_main_system(website_generation_result: Dict[str, Any],
     mcp_orchestrator = MCPOrchestrator(mcp_config)
     
     # Run full deployment pipeline
-    pipeline_result = await mcp_orchestrator.full_deployment_pipeline(
-        website_generation_result,
-        project_name
-    )
+    try:
+        pipeline_result = await mcp_orchestrator.full_deployment_pipeline(
+            website_generation_result,
+            project_name
+        )
+    finally:
+        await mcp_orchestrator.close()
     
     return {
         'success': pipeline_result['success'],
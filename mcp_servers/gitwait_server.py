@@ -9,19 +9,31 @@ https://docs.github.com/en/copilot/how-tos/context/model-context-protocol/using-
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import os
+import random
 import sys
 import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence
 from dataclasses import dataclass, asdict
 from enum import Enum
-import subprocess
-import requests
+from collections import OrderedDict
+import hashlib
+import hmac
+import aiohttp
+from aiohttp import web
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # MCP imports
 import mcp.types as types
 from mcp.server.models import InitializationOptions
@@ -32,6 +44,94 @@ from mcp.server.stdio import stdio_server
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("gitwait-mcp")
 
+# Seconds a GitHub status response is shared between waiters before refetching
+CI_STATUS_CACHE_TTL = 5
+PR_STATUS_CACHE_TTL = 30
+API_CACHE_SIZE = 256
+CHECK_RUNS_PER_PAGE = 100  # the API maximum
+
+# Throttle once fewer than this many requests remain; rate-limit headers younger
+# than RATE_STATE_MAX_AGE seconds answer check_rate_limits without a request
+RATE_LIMIT_LOW_WATER = 100
+RATE_STATE_MAX_AGE = 60
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Commit status and check runs in one round trip. Commits with more suites or
+# runs than one page holds fall back to the paginated REST check-runs listing.
+CI_STATUS_QUERY = """
+query($owner: String!, $name: String!, $sha: GitObjectID!) {
+  repository(owner: $owner, name: $name) {
+    object(oid: $sha) {
+      ... on Commit {
+        status { contexts { state context description targetUrl } }
+        checkSuites(first: 50) {
+          pageInfo { hasNextPage }
+          nodes {
+            checkRuns(first: 100) {
+              pageInfo { hasNextPage }
+              nodes { name status conclusion detailsUrl }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Check run conclusions that fail the commit, as in GitHub's status check rollup
+FAILING_CONCLUSIONS = frozenset(("failure", "timed_out", "cancelled", "action_required", "startup_failure"))
+
+def _check_summary(name: str, status: str, conclusion: Optional[str], html_url: str) -> Dict[str, Any]:
+    """One check run in the shape both CI status paths return"""
+    return {
+        "name": name,
+        "status": status.lower(),
+        "conclusion": conclusion.lower() if conclusion else None,
+        "html_url": html_url
+    }
+
+def _rollup_state(statuses: List[Dict[str, Any]], checks: List[Dict[str, Any]]) -> str:
+    """Overall CI state from commit statuses and check runs together
+    
+    Any failing status or run fails the commit; anything unfinished keeps it
+    pending. A commit with neither is pending, as in the REST combined status.
+    """
+    states = [status["state"] for status in statuses]
+    for check in checks:
+        if check["status"] != "completed":
+            states.append("pending")
+        elif check["conclusion"] in FAILING_CONCLUSIONS:
+            states.append("failure")
+        else:
+            states.append("success")
+    
+    if "failure" in states or "error" in states:
+        return "failure"
+    if not states or "pending" in states:
+        return "pending"
+    return "success"
+
+def _dumps(obj: Any) -> str:
+    """Indented JSON for tool responses, via orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+class GraphQLError(Exception):
+    """A GraphQL request GitHub rejected (as opposed to a network failure)"""
+    
+    def __init__(self, status: int, message: str, error_types: Sequence[str] = ()):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.error_types = set(error_types)
+    
+    @property
+    def denied(self) -> bool:
+        """The token can't use GraphQL here at all, so retrying is pointless"""
+        return self.status in (401, 403) or bool(self.error_types & {"FORBIDDEN", "INSUFFICIENT_SCOPES"})
+
 class WaitType(Enum):
     """Types of wait operations supported"""
     CI_PIPELINE = "ci_pipeline"
@@ -50,7 +150,7 @@ class OperationStatus(Enum):
     CANCELLED = "cancelled"
     WAITING = "waiting"
 
-@dataclass
+@dataclass(slots=True)
 class GitOperation:
     """Represents a git operation in the queue"""
     id: str
@@ -67,7 +167,7 @@ class GitOperation:
     branch: Optional[str] = None
     pr_number: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class WaitConfig:
     """Configuration for wait operations"""
     default_ci_wait: int = 300  # 5 minutes
@@ -76,14 +176,34 @@ class WaitConfig:
     rate_limit_delay: int = 60  # 1 minute
     github_token: Optional[str] = None
     webhook_url: Optional[str] = None
+    webhook_port: Optional[int] = None  # listen for GitHub webhooks to end waits early
+    webhook_secret: Optional[str] = None
+    worker_concurrency: int = 4  # queued operations run at the same time
+    git_concurrency: int = 3     # git processes running at the same time
+    max_concurrent_gh_requests: int = 8  # GitHub API requests in flight at once
 
 class GitWaitServer:
     """Main GitWait MCP server implementation"""
     
     def __init__(self):
         self.config = WaitConfig()
-        self.operation_queue: List[GitOperation] = []
+        # Priority queue of (-priority, seq, operation); seq keeps equal priorities FIFO.
+        # Cancelled operations stay in the heap as tombstones and are skipped on pop.
+        self._heap: List[tuple] = []
+        self._seq = 0
+        self._id_counter = itertools.count()
+        # Per-process prefix so ids kept from an earlier run never match new operations
+        self._boot_id = os.urandom(3).hex()
+        self._queued: Dict[str, tuple] = {}
         self.active_operations: Dict[str, GitOperation] = {}
+        # Every queued or running operation by id, so status lookups and cancels
+        # need a single dict hit whichever state the operation is in
+        self._by_id: Dict[str, GitOperation] = {}
+        self._workers: List[asyncio.Task] = []
+        self._work_available: Optional[asyncio.Event] = None  # created in the running loop
+        # Repositories a worker is running an operation for; operations on the
+        # same repository still run one at a time, in queue order
+        self._busy_repos: set = set()
         self.github_token = os.getenv("GITHUB_TOKEN")
         self.webhook_url = os.getenv("GITWAIT_WEBHOOK_URL")
         
@@ -94,27 +214,325 @@ class GitWaitServer:
         self.config.default_pr_wait = int(os.getenv("GITWAIT_PR_WAIT", "600"))
         self.config.max_wait_time = int(os.getenv("GITWAIT_MAX_WAIT", "3600"))
         self.config.rate_limit_delay = int(os.getenv("GITWAIT_RATE_LIMIT", "60"))
+        if os.getenv("GITWAIT_WEBHOOK_PORT"):
+            self.config.webhook_port = int(os.getenv("GITWAIT_WEBHOOK_PORT"))
+        self.config.webhook_secret = os.getenv("GITWAIT_WEBHOOK_SECRET")
+        self.config.worker_concurrency = int(os.getenv("GITWAIT_WORKERS", "4"))
+        self.config.git_concurrency = int(os.getenv("GITWAIT_GIT_CONCURRENCY", "3"))
+        self.config.max_concurrent_gh_requests = int(os.getenv("GITWAIT_GH_CONCURRENCY", "8"))
+        self._git_slots = asyncio.Semaphore(self.config.git_concurrency)
+        # Bursts of parallel API calls trip GitHub's secondary rate limits
+        self._gh_gate = asyncio.Semaphore(self.config.max_concurrent_gh_requests)
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        # url -> (fetched_at, status, json, etag), least recently used first
+        self._api_cache: OrderedDict = OrderedDict()
+        self._rate_state: Optional[Dict[str, Any]] = None
+        # Cleared if the token can't use GraphQL, so CI checks stay on REST
+        self._graphql_enabled = True
+        
+        # ("ci", repo, sha) / ("pr", repo, number) -> Event set by webhook deliveries
+        self._wait_events: Dict[tuple, asyncio.Event] = {}
+        self._webhook_runner: Optional[web.AppRunner] = None
+        # Same keys -> the task polling on behalf of every concurrent waiter
+        self._inflight: Dict[tuple, asyncio.Task] = {}
         
         logger.info("GitWait MCP Server initialized")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared GitHub session, created on first use so connections are pooled and kept alive"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                # Everything goes to api.github.com, so size the pool per host and
+                # keep idle connections long enough to span a poll interval
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=60),
+                headers={
+                    "Authorization": f"token {self.github_token}",
+                    "Accept": "application/vnd.github.v3+json"
+                }
+            )
+        return self._session
+    
+    async def _http_get(self, url: str, raise_for_status: bool = True, timeout: int = 30,
+                        headers: Optional[Dict[str, str]] = None, throttle: bool = True) -> tuple:
+        """GET a GitHub API URL without blocking the event loop; returns (status, json, headers)"""
+        if throttle:
+            await self._respect_rate_limit()
+        
+        session = await self._get_session()
+        async with self._gh_gate, session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            self._record_rate_limit(response.headers)
+            if response.status == 304:
+                return response.status, None, response.headers
+            data = await response.json()
+            if raise_for_status and response.status >= 400:
+                raise aiohttp.ClientError(f"{response.status} error for {url}: {data.get('message', '')}")
+            return response.status, data, response.headers
+    
+    def _record_rate_limit(self, headers):
+        """Track the rate-limit headers GitHub sends on every response"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            self._rate_state = {
+                "remaining": int(remaining),
+                "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                "reset": int(headers.get("X-RateLimit-Reset", 0)),
+                "updated_at": time.monotonic()
+            }
+        except ValueError:
+            pass
+    
+    async def _respect_rate_limit(self):
+        """Back off before a request when the last response said the limit is nearly spent"""
+        state = self._rate_state
+        if state is None or state["remaining"] >= RATE_LIMIT_LOW_WATER:
+            return
+        wait = min(state["reset"] - time.time(), self.config.rate_limit_delay)
+        if wait > 0:
+            logger.warning(f"GitHub rate limit low ({state['remaining']} left), waiting {wait:.0f}s")
+            await asyncio.sleep(wait)
+    
+    def _rate_limit_summary(self, remaining: int, limit: int, reset_time: int) -> Dict[str, Any]:
+        should_wait = remaining < RATE_LIMIT_LOW_WATER  # Wait if less than 100 requests remaining
+        
+        return {
+            "rate_limit_remaining": remaining,
+            "rate_limit_total": limit,
+            "reset_time": datetime.fromtimestamp(reset_time).isoformat(),
+            "should_wait": should_wait,
+            "recommended_wait": self.config.rate_limit_delay if should_wait else 0
+        }
+    
+    async def _cached_get(self, url: str, ttl: float, raise_for_status: bool = True) -> tuple:
+        """GET with a short TTL cache shared by all waiters; returns (status, json)
+        
+        Once an entry expires it is revalidated with If-None-Match, and a 304
+        (which doesn't count against the rate limit) reuses the cached body.
+        """
+        now = time.monotonic()
+        entry = self._api_cache.get(url)
+        if entry is not None:
+            self._api_cache.move_to_end(url)
+            if now - entry[0] < ttl:
+                return entry[1], entry[2]
+        
+        headers = {"If-None-Match": entry[3]} if entry is not None and entry[3] else None
+        status, data, response_headers = await self._http_get(url, raise_for_status, headers=headers)
+        
+        if status == 304 and entry is not None:
+            status, data = entry[1], entry[2]
+        elif status != 200:
+            return status, data
+        
+        self._api_cache[url] = (now, status, data, response_headers.get("ETag"))
+        self._api_cache.move_to_end(url)
+        if len(self._api_cache) > API_CACHE_SIZE:
+            self._api_cache.popitem(last=False)
+        return status, data
+    
+    async def _graphql_query(self, query: str, variables: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
+        """POST a GraphQL query and return its data
+        
+        GraphQL has its own rate-limit budget, so its headers are not recorded
+        into the REST rate-limit state.
+        """
+        session = await self._get_session()
+        async with self._gh_gate, session.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            body = await response.json()
+            if response.status >= 400 or body.get("errors"):
+                errors = body.get("errors") or [{"message": body.get("message", "")}]
+                raise GraphQLError(
+                    response.status,
+                    "; ".join(e.get("message", "") for e in errors),
+                    [e.get("type") for e in errors if e.get("type")]
+                )
+            return body["data"]
+    
+    async def close(self):
+        """Close the shared GitHub session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @staticmethod
+    def _next_backoff(attempt: int, base: float = 2.0, cap: float = 60.0) -> float:
+        """Truncated exponential backoff with jitter, so parallel waits don't poll in lockstep"""
+        return min(cap, base * (2 ** attempt)) + random.uniform(0, 1)
+    
+    async def _backoff_sleep(self, attempt: int, remaining: float,
+                             wait_key: Optional[tuple] = None):
+        """Sleep for the next backoff interval, but never past the wait's remaining time
+        
+        If a webhook delivery for wait_key arrives first, wake up immediately.
+        """
+        delay = max(0.0, min(self._next_backoff(attempt), remaining))
+        
+        event = self._wait_events.get(wait_key) if wait_key else None
+        if event is None:
+            await asyncio.sleep(delay)
+            return
+        
+        try:
+            await asyncio.wait_for(event.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        event.clear()
+    
+    def _register_wait(self, wait_key: tuple) -> Optional[tuple]:
+        """Make wait_key wakeable by webhooks; returns None when no listener is running"""
+        if self._webhook_runner is None:
+            return None
+        self._wait_events.setdefault(wait_key, asyncio.Event())
+        return wait_key
+    
+    async def start_webhook_listener(self, port: int):
+        """Serve POST /webhook so GitHub check, status and pull_request events end waits early"""
+        app = web.Application()
+        app.router.add_post("/webhook", self._handle_webhook)
+        app.router.add_post("/webhook/{tail:.*}", self._handle_webhook)
+        
+        self._webhook_runner = web.AppRunner(app)
+        await self._webhook_runner.setup()
+        await web.TCPSite(self._webhook_runner, port=port).start()
+        logger.info(f"Listening for GitHub webhooks on port {port}")
+    
+    async def stop_webhook_listener(self):
+        if self._webhook_runner is not None:
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
+    
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        """Wake the waiters a GitHub event concerns and drop their cached status"""
+        body = await request.read()
+        
+        if self.config.webhook_secret:
+            expected = "sha256=" + hmac.new(
+                self.config.webhook_secret.encode(), body, hashlib.sha256
+            ).hexdigest()
+            if not hmac.compare_digest(expected, request.headers.get("X-Hub-Signature-256", "")):
+                return web.Response(status=401)
+        
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400)
+        
+        event_type = request.headers.get("X-GitHub-Event", "")
+        repository = payload.get("repository", {}).get("full_name")
+        
+        if event_type in ("check_run", "check_suite"):
+            wait_key = ("ci", repository, payload.get(event_type, {}).get("head_sha"))
+            url_part = f"/repos/{repository}/commits/{wait_key[2]}/"
+        elif event_type == "status":
+            wait_key = ("ci", repository, payload.get("sha"))
+            url_part = f"/repos/{repository}/commits/{wait_key[2]}/"
+        elif event_type == "pull_request":
+            wait_key = ("pr", repository, payload.get("number"))
+            url_part = f"/repos/{repository}/pulls/{wait_key[2]}"
+        else:
+            return web.Response(status=204)
+        
+        for url in [url for url in self._api_cache if url_part in url]:
+            del self._api_cache[url]
+        
+        event = self._wait_events.get(wait_key)
+        if event is not None:
+            event.set()
+        
+        return web.Response(status=204)
+    
+    async def _single_flight(self, key: tuple, timeout: float, poll) -> Dict[str, Any]:
+        """Share one poller between all concurrent waits on the same commit or PR
+        
+        The first caller starts poll(wait_key, timeout) as a task; later callers
+        await the same task. It is shielded so one caller cancelling doesn't end
+        the wait for the others. Each caller still gets its own timeout: it
+        stops waiting at its own deadline, and if the shared poll timed out
+        first it starts or joins another one for the time it has left.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._run_wait(key, poll, remaining))
+                self._inflight[key] = task
+                task.add_done_callback(
+                    lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None
+                )
+            else:
+                logger.info(f"Joining existing wait for {key[1]} {key[2]}")
+            
+            try:
+                result = await asyncio.wait_for(asyncio.shield(task), max(0.0, remaining))
+            except asyncio.TimeoutError:
+                return self._timeout_result(key[0], timeout)
+            
+            if result.get("status") != "timeout":
+                return result
+            if deadline - time.monotonic() <= 0:
+                return self._timeout_result(key[0], timeout)
+    
+    async def _run_wait(self, key: tuple, poll, timeout: float) -> Dict[str, Any]:
+        wait_key = self._register_wait(key)
+        try:
+            return await poll(wait_key, timeout)
+        finally:
+            self._wait_events.pop(wait_key, None)
+    
+    @staticmethod
+    def _timeout_result(kind: str, timeout: float) -> Dict[str, Any]:
+        """Result of a CI ("ci") or pull request ("pr") wait that ran out of time"""
+        what = "CI pipeline did not complete" if kind == "ci" else "Pull request did not merge"
+        return {
+            "success": False,
+            "status": "timeout",
+            "duration": timeout,
+            "error": f"{what} within {timeout} seconds"
+        }
+    
     async def wait_for_ci_pipeline(self, repository: str, commit_sha: str, 
                                   timeout: int = None) -> Dict[str, Any]:
         """Wait for CI/CD pipeline to complete"""
         timeout = timeout or self.config.default_ci_wait
-        start_time = time.time()
+        return await self._single_flight(
+            ("ci", repository, commit_sha), timeout,
+            lambda wait_key, remaining: self._poll_ci_pipeline(repository, commit_sha, remaining, wait_key)
+        )
+    
+    async def _poll_ci_pipeline(self, repository: str, commit_sha: str, timeout: int,
+                                wait_key: Optional[tuple]) -> Dict[str, Any]:
+        start = time.monotonic()
         
         logger.info(f"Waiting for CI pipeline: {repository}@{commit_sha}")
         
-        while time.time() - start_time < timeout:
+        attempt = 0
+        last_state = None
+        
+        elapsed = 0.0
+        while elapsed < timeout:
             try:
                 status = await self._check_ci_status(repository, commit_sha)
+                elapsed = time.monotonic() - start
+                
+                if status["state"] != last_state:
+                    last_state = status["state"]
+                    attempt = 0
                 
                 if status["state"] == "success":
                     return {
                         "success": True,
                         "status": "completed",
                         "state": status["state"],
-                        "duration": time.time() - start_time,
+                        "duration": elapsed,
                         "checks": status.get("checks", [])
                     }
                 elif status["state"] == "failure":
@@ -122,25 +540,23 @@ class GitWaitServer:
                         "success": False,
                         "status": "failed",
                         "state": status["state"],
-                        "duration": time.time() - start_time,
+                        "duration": elapsed,
                         "error": status.get("error", "CI pipeline failed"),
                         "checks": status.get("checks", [])
                     }
                 elif status["state"] in ["pending", "running"]:
                     logger.info(f"CI still running, waiting... ({status['state']})")
-                    await asyncio.sleep(30)  # Check every 30 seconds
-                    continue
+                    await self._backoff_sleep(attempt, timeout - elapsed, wait_key)
+                    attempt += 1
                 
             except Exception as e:
                 logger.error(f"Error checking CI status: {str(e)}")
-                await asyncio.sleep(60)  # Wait longer on error
+                await self._backoff_sleep(attempt, timeout - elapsed, wait_key)
+                attempt += 1
+            
+            elapsed = time.monotonic() - start
         
-        return {
-            "success": False,
-            "status": "timeout",
-            "duration": timeout,
-            "error": f"CI pipeline did not complete within {timeout} seconds"
-        }
+        return self._timeout_result("ci", timeout)
     
     async def _check_ci_status(self, repository: str, commit_sha: str) -> Dict[str, Any]:
         """Check GitHub CI status for a commit"""
@@ -148,53 +564,172 @@ class GitWaitServer:
             # Fallback to local git status check
             return await self._check_local_status(repository, commit_sha)
         
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+        owner, _, name = repository.partition("/")
+        if self._graphql_enabled and owner and name and "/" not in name:
+            try:
+                return await self._check_ci_status_graphql(owner, name, commit_sha)
+            except GraphQLError as e:
+                if e.denied:
+                    logger.warning(f"GraphQL CI check unavailable, using REST: {e}")
+                    self._graphql_enabled = False
+                else:
+                    logger.warning(f"GraphQL CI check failed, retrying over REST: {e}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"GraphQL CI check failed, retrying over REST: {str(e)}")
         
-        # Check commit status
+        # Check commit status and check runs concurrently
         url = f"https://api.github.com/repos/{repository}/commits/{commit_sha}/status"
+        check_runs_url = f"https://api.github.com/repos/{repository}/commits/{commit_sha}/check-runs"
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            status_result, checks_result = await asyncio.gather(
+                self._cached_get(url, CI_STATUS_CACHE_TTL),
+                self._get_check_runs(check_runs_url),
+                return_exceptions=True
+            )
             
-            # Also check check runs
-            check_runs_url = f"https://api.github.com/repos/{repository}/commits/{commit_sha}/check-runs"
-            check_response = requests.get(check_runs_url, headers=headers, timeout=30)
-            check_data = check_response.json() if check_response.status_code == 200 else {"check_runs": []}
+            if isinstance(status_result, BaseException):
+                raise status_result
+            _, data = status_result
+            
+            # A failed check-runs fetch shouldn't discard the commit status
+            if isinstance(checks_result, BaseException):
+                logger.warning(f"Check runs unavailable: {str(checks_result)}")
+                check_data = {"check_runs": []}
+            else:
+                check_status, check_data = checks_result
+                if check_status != 200:
+                    check_data = {"check_runs": []}
+            
+            statuses = [
+                {
+                    "state": status["state"],
+                    "context": status["context"],
+                    "description": status.get("description"),
+                    "target_url": status.get("target_url")
+                }
+                for status in data.get("statuses", [])
+            ]
+            checks = [
+                _check_summary(run["name"], run["status"], run.get("conclusion"), run.get("html_url"))
+                for run in check_data.get("check_runs", [])
+            ]
             
             return {
-                "state": data.get("state", "pending"),
-                "statuses": data.get("statuses", []),
-                "checks": check_data.get("check_runs", []),
+                "state": _rollup_state(statuses, checks),
+                "statuses": statuses,
+                "checks": checks,
                 "total_count": data.get("total_count", 0)
             }
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"GitHub API error: {str(e)}")
             return {"state": "error", "error": str(e)}
     
+    async def _get_check_runs(self, check_runs_url: str) -> tuple:
+        """Fetch every page of a commit's check runs; returns (status, json) like _cached_get
+        
+        The first page's total_count gives the page count, so the remaining
+        pages are fetched concurrently rather than by following Link headers.
+        """
+        status, data = await self._cached_get(
+            f"{check_runs_url}?per_page={CHECK_RUNS_PER_PAGE}&page=1",
+            CI_STATUS_CACHE_TTL, raise_for_status=False
+        )
+        if status != 200:
+            return status, data
+        
+        pages = -(-data.get("total_count", 0) // CHECK_RUNS_PER_PAGE)
+        if pages <= 1:
+            return status, data
+        
+        rest = await asyncio.gather(*[
+            self._cached_get(f"{check_runs_url}?per_page={CHECK_RUNS_PER_PAGE}&page={page}", CI_STATUS_CACHE_TTL)
+            for page in range(2, pages + 1)
+        ])
+        check_runs = list(data.get("check_runs", []))
+        for _, page_data in rest:
+            check_runs.extend(page_data.get("check_runs", []))
+        return status, {**data, "check_runs": check_runs}
+    
+    async def _check_ci_status_graphql(self, owner: str, name: str, commit_sha: str) -> Dict[str, Any]:
+        """One GraphQL request in place of the status and check-runs REST calls
+        
+        The response is reshaped into what _check_ci_status returns over REST,
+        and cached with the same TTL so webhook deliveries invalidate it.
+        """
+        cache_key = f"graphql:/repos/{owner}/{name}/commits/{commit_sha}/"
+        now = time.monotonic()
+        entry = self._api_cache.get(cache_key)
+        if entry is not None and now - entry[0] < CI_STATUS_CACHE_TTL:
+            self._api_cache.move_to_end(cache_key)
+            return entry[2]
+        
+        data = await self._graphql_query(
+            CI_STATUS_QUERY, {"owner": owner, "name": name, "sha": commit_sha}
+        )
+        commit = (data.get("repository") or {}).get("object")
+        if commit is None:
+            raise GraphQLError(200, f"Commit {commit_sha} not found in {owner}/{name}")
+        
+        statuses = [
+            {
+                "state": context["state"].lower(),
+                "context": context["context"],
+                "description": context["description"],
+                "target_url": context["targetUrl"]
+            }
+            for context in (commit.get("status") or {}).get("contexts", [])
+        ]
+        suites = commit["checkSuites"]
+        if suites["pageInfo"]["hasNextPage"] or any(
+            suite["checkRuns"]["pageInfo"]["hasNextPage"] for suite in suites["nodes"]
+        ):
+            # Too many runs for one query; list them all over REST instead of truncating
+            check_status, check_data = await self._get_check_runs(
+                f"https://api.github.com/repos/{owner}/{name}/commits/{commit_sha}/check-runs"
+            )
+            if check_status != 200:
+                raise GraphQLError(check_status, f"Check runs unavailable for {commit_sha}")
+            checks = [
+                _check_summary(run["name"], run["status"], run.get("conclusion"), run.get("html_url"))
+                for run in check_data.get("check_runs", [])
+            ]
+        else:
+            checks = [
+                _check_summary(run["name"], run["status"], run["conclusion"], run["detailsUrl"])
+                for suite in suites["nodes"]
+                for run in suite["checkRuns"]["nodes"]
+            ]
+        
+        result = {
+            # Derived like the REST path rather than from statusCheckRollup, so both agree
+            "state": _rollup_state(statuses, checks),
+            "statuses": statuses,
+            "checks": checks,
+            # Like the REST combined status, total_count counts commit statuses, not check runs
+            "total_count": len(statuses)
+        }
+        
+        self._api_cache[cache_key] = (now, 200, result, None)
+        if len(self._api_cache) > API_CACHE_SIZE:
+            self._api_cache.popitem(last=False)
+        return result
+    
     async def _check_local_status(self, repository: str, commit_sha: str) -> Dict[str, Any]:
         """Fallback to check local git status when no GitHub token"""
         try:
             # Simple check if commit exists and is reachable
-            result = subprocess.run(
-                ["git", "cat-file", "-e", commit_sha],
-                cwd=repository,
-                capture_output=True,
-                text=True,
-                timeout=10
+            returncode, _, _ = await self._run_process(
+                ["git", "cat-file", "-e", commit_sha], cwd=repository, timeout=10
             )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {"state": "success", "checks": [], "local_check": True}
             else:
                 return {"state": "pending", "checks": [], "local_check": True}
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {"state": "error", "error": "Git command timeout"}
         except Exception as e:
             return {"state": "error", "error": str(e)}
@@ -203,60 +738,67 @@ class GitWaitServer:
                                timeout: int = None) -> Dict[str, Any]:
         """Wait for pull request to be merged"""
         timeout = timeout or self.config.default_pr_wait
-        start_time = time.time()
+        return await self._single_flight(
+            ("pr", repository, pr_number), timeout,
+            lambda wait_key, remaining: self._poll_pr_merge(repository, pr_number, remaining, wait_key)
+        )
+    
+    async def _poll_pr_merge(self, repository: str, pr_number: int, timeout: int,
+                             wait_key: Optional[tuple]) -> Dict[str, Any]:
+        start = time.monotonic()
         
         logger.info(f"Waiting for PR merge: {repository}#{pr_number}")
         
-        while time.time() - start_time < timeout:
+        attempt = 0
+        last_mergeable = None
+        
+        elapsed = 0.0
+        while elapsed < timeout:
             try:
                 status = await self._check_pr_status(repository, pr_number)
+                elapsed = time.monotonic() - start
+                
+                if status.get("mergeable") != last_mergeable:
+                    last_mergeable = status.get("mergeable")
+                    attempt = 0
                 
                 if status["state"] == "merged":
                     return {
                         "success": True,
                         "status": "merged",
-                        "duration": time.time() - start_time,
+                        "duration": elapsed,
                         "merge_commit_sha": status.get("merge_commit_sha")
                     }
                 elif status["state"] == "closed":
                     return {
                         "success": False,
                         "status": "closed",
-                        "duration": time.time() - start_time,
+                        "duration": elapsed,
                         "error": "Pull request was closed without merging"
                     }
                 elif status["state"] == "open":
                     logger.info(f"PR still open, waiting... (mergeable: {status.get('mergeable')})")
-                    await asyncio.sleep(60)  # Check every minute
-                    continue
+                    await self._backoff_sleep(attempt, timeout - elapsed, wait_key)
+                    attempt += 1
                     
             except Exception as e:
                 logger.error(f"Error checking PR status: {str(e)}")
-                await asyncio.sleep(60)
+                await self._backoff_sleep(attempt, timeout - elapsed, wait_key)
+                attempt += 1
+            
+            elapsed = time.monotonic() - start
         
-        return {
-            "success": False,
-            "status": "timeout",
-            "duration": timeout,
-            "error": f"Pull request did not merge within {timeout} seconds"
-        }
+        return self._timeout_result("pr", timeout)
     
     async def _check_pr_status(self, repository: str, pr_number: int) -> Dict[str, Any]:
         """Check GitHub PR status"""
         if not self.github_token:
             return {"state": "unknown", "error": "No GitHub token available"}
         
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
         url = f"https://api.github.com/repos/{repository}/pulls/{pr_number}"
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            _, data = await self._cached_get(url, PR_STATUS_CACHE_TTL)
             
             return {
                 "state": data.get("state"),
@@ -267,7 +809,7 @@ class GitWaitServer:
                 "base_ref": data.get("base", {}).get("ref")
             }
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"GitHub API error: {str(e)}")
             return {"state": "error", "error": str(e)}
     
@@ -276,7 +818,7 @@ class GitWaitServer:
                                  priority: int = 1, repository: str = None) -> str:
         """Queue a git operation with specified wait conditions"""
         
-        operation_id = f"gitwait_{int(time.time() * 1000000)}"
+        operation_id = f"gw_{self._boot_id}_{next(self._id_counter):x}"
         
         operation = GitOperation(
             id=operation_id,
@@ -290,64 +832,151 @@ class GitWaitServer:
             repository=repository
         )
         
-        # Insert in priority order
-        inserted = False
-        for i, existing_op in enumerate(self.operation_queue):
-            if priority > existing_op.priority:
-                self.operation_queue.insert(i, operation)
-                inserted = True
-                break
-        
-        if not inserted:
-            self.operation_queue.append(operation)
+        self._push(operation)
         
         logger.info(f"Queued git operation: {operation_id} ({command} {' '.join(args)})")
         
-        # Start processing queue if not already running
-        asyncio.create_task(self._process_queue())
+        # Wake idle workers, starting the pool on first use
+        self._start_workers()
+        self._work_available.set()
         
         return operation_id
     
+    def _push(self, operation: GitOperation):
+        """Add an operation to the priority queue (higher priority first)"""
+        entry = (-operation.priority, self._seq, operation)
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        self._queued[operation.id] = entry
+        self._by_id[operation.id] = operation
+    
+    @staticmethod
+    def _repo_key(operation: GitOperation) -> str:
+        return operation.repository or os.getcwd()
+    
+    def _pop(self) -> Optional[GitOperation]:
+        """Remove and return the next runnable operation and mark its repository busy
+        
+        Cancelled operations are dropped. Operations for a repository another
+        worker is busy with stay queued in order, so a worker never sits on
+        one while other repositories have work waiting.
+        """
+        skipped = []
+        operation = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            candidate = entry[2]
+            if candidate.status == OperationStatus.CANCELLED:
+                continue
+            if self._repo_key(candidate) in self._busy_repos:
+                skipped.append(entry)
+                continue
+            operation = candidate
+            self._queued.pop(operation.id, None)
+            self._busy_repos.add(self._repo_key(operation))
+            break
+        
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return operation
+    
+    def queued_operations(self, limit: Optional[int] = None) -> List[GitOperation]:
+        """Queued operations in execution order"""
+        live = (entry for entry in self._heap if entry[2].status != OperationStatus.CANCELLED)
+        entries = heapq.nsmallest(limit, live) if limit is not None else sorted(live)
+        return [operation for _, _, operation in entries]
+    
+    def _start_workers(self):
+        """Start the long-lived worker pool, replacing any worker that has died"""
+        if self._work_available is None:
+            self._work_available = asyncio.Event()
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        for _ in range(self.config.worker_concurrency - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._process_queue()))
+    
+    async def stop_workers(self):
+        """Cancel the worker pool; operations still queued stay queued"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
     async def _process_queue(self):
-        """Process the git operation queue"""
-        while self.operation_queue:
-            operation = self.operation_queue.pop(0)
+        """Worker loop: drain the git operation queue, then sleep until more is queued"""
+        while True:
+            operation = self._pop()
+            if operation is None:
+                self._work_available.clear()
+                await self._work_available.wait()
+                continue
             self.active_operations[operation.id] = operation
             
             try:
-                operation.status = OperationStatus.RUNNING
-                logger.info(f"Processing operation: {operation.id}")
-                
-                # Apply wait conditions
-                if operation.wait_type == WaitType.CUSTOM_DELAY and operation.wait_duration > 0:
-                    logger.info(f"Waiting {operation.wait_duration} seconds before executing")
-                    await asyncio.sleep(operation.wait_duration)
-                
-                # Execute the git command
-                result = await self._execute_git_command(operation)
-                
-                if result["success"]:
-                    operation.status = OperationStatus.SUCCESS
-                    logger.info(f"Operation completed successfully: {operation.id}")
-                else:
-                    operation.status = OperationStatus.FAILED
-                    logger.error(f"Operation failed: {operation.id} - {result.get('error')}")
-                    
-                    # Retry if configured
-                    if operation.current_retries < operation.max_retries:
-                        operation.current_retries += 1
-                        operation.status = OperationStatus.PENDING
-                        self.operation_queue.insert(0, operation)  # Retry at front of queue
-                        logger.info(f"Retrying operation: {operation.id} (attempt {operation.current_retries + 1})")
-                        continue
-                
-            except Exception as e:
-                logger.error(f"Error processing operation {operation.id}: {str(e)}")
-                operation.status = OperationStatus.FAILED
-            
+                await self._run_operation(operation)
             finally:
+                # The repository is free again; wake workers that skipped its operations
+                self._busy_repos.discard(self._repo_key(operation))
+                self._work_available.set()
                 if operation.status != OperationStatus.PENDING:  # Don't remove if retrying
                     self.active_operations.pop(operation.id, None)
+                    self._by_id.pop(operation.id, None)
+    
+    async def _run_operation(self, operation: GitOperation):
+        """Apply an operation's wait condition, run it and requeue it on failure"""
+        try:
+            operation.status = OperationStatus.RUNNING
+            logger.info(f"Processing operation: {operation.id}")
+            
+            # Apply wait conditions
+            if operation.wait_type is WaitType.CUSTOM_DELAY and operation.wait_duration > 0:
+                logger.info(f"Waiting {operation.wait_duration} seconds before executing")
+                await asyncio.sleep(operation.wait_duration)
+            
+            # Execute the git command
+            result = await self._execute_git_command(operation)
+            
+            if result["success"]:
+                operation.status = OperationStatus.SUCCESS
+                logger.info(f"Operation completed successfully: {operation.id}")
+            else:
+                operation.status = OperationStatus.FAILED
+                logger.error(f"Operation failed: {operation.id} - {result.get('error')}")
+                
+                # Retry if configured
+                if operation.current_retries < operation.max_retries:
+                    operation.current_retries += 1
+                    operation.status = OperationStatus.PENDING
+                    self._push(operation)  # Retry behind operations of the same priority
+                    logger.info(f"Retrying operation: {operation.id} (attempt {operation.current_retries + 1})")
+            
+        except Exception as e:
+            logger.error(f"Error processing operation {operation.id}: {str(e)}")
+            operation.status = OperationStatus.FAILED
+    
+    @staticmethod
+    async def _run_process(cmd: List[str], cwd: str, timeout: float) -> tuple:
+        """Run a command without blocking the event loop
+        
+        Returns (returncode, stdout, stderr) with output decoded. On timeout
+        the process is killed and asyncio.TimeoutError is raised.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return (
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace")
+        )
     
     async def _execute_git_command(self, operation: GitOperation) -> Dict[str, Any]:
         """Execute a git command"""
@@ -356,31 +985,28 @@ class GitWaitServer:
             
             cwd = operation.repository if operation.repository else os.getcwd()
             
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            async with self._git_slots:
+                returncode, stdout, stderr = await self._run_process(
+                    cmd, cwd=cwd, timeout=300  # 5 minute timeout
+                )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "success": True,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "returncode": result.returncode
+                    "stdout": stdout,
+                    "stderr": stderr,
+                    "returncode": returncode
                 }
             else:
                 return {
                     "success": False,
-                    "error": f"Command failed with code {result.returncode}",
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "returncode": result.returncode
+                    "error": f"Command failed with code {returncode}",
+                    "stdout": stdout,
+                    "stderr": stderr,
+                    "returncode": returncode
                 }
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": "Command timeout after 5 minutes"
@@ -393,52 +1019,52 @@ class GitWaitServer:
     
     async def get_operation_status(self, operation_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a queued or active operation"""
-        # Check active operations
-        if operation_id in self.active_operations:
-            operation = self.active_operations[operation_id]
+        operation = self._by_id.get(operation_id)
+        if operation is None:
+            return None
+        
+        # Check queued operations
+        entry = self._queued.get(operation_id)
+        if entry is not None:
             return {
                 "id": operation.id,
                 "status": operation.status.value,
                 "command": operation.command,
                 "args": operation.args,
                 "created_at": operation.created_at.isoformat(),
-                "retries": operation.current_retries,
+                "position_in_queue": sum(
+                    1 for other in self._heap
+                    if other < entry and other[2].status != OperationStatus.CANCELLED
+                ),
                 "wait_type": operation.wait_type.value
             }
         
-        # Check queued operations
-        for operation in self.operation_queue:
-            if operation.id == operation_id:
-                return {
-                    "id": operation.id,
-                    "status": operation.status.value,
-                    "command": operation.command,
-                    "args": operation.args,
-                    "created_at": operation.created_at.isoformat(),
-                    "position_in_queue": self.operation_queue.index(operation),
-                    "wait_type": operation.wait_type.value
-                }
-        
-        return None
+        # Otherwise it is active
+        return {
+            "id": operation.id,
+            "status": operation.status.value,
+            "command": operation.command,
+            "args": operation.args,
+            "created_at": operation.created_at.isoformat(),
+            "retries": operation.current_retries,
+            "wait_type": operation.wait_type.value
+        }
     
     async def cancel_operation(self, operation_id: str) -> bool:
         """Cancel a queued or active operation"""
-        # Remove from queue
-        for i, operation in enumerate(self.operation_queue):
-            if operation.id == operation_id:
-                operation.status = OperationStatus.CANCELLED
-                self.operation_queue.pop(i)
-                logger.info(f"Cancelled queued operation: {operation_id}")
-                return True
-        
-        # Cancel active operation
-        if operation_id in self.active_operations:
-            operation = self.active_operations[operation_id]
-            operation.status = OperationStatus.CANCELLED
-            logger.info(f"Cancelled active operation: {operation_id}")
-            return True
+        operation = self._by_id.get(operation_id)
+        if operation is None:
+            return False
+        
+        operation.status = OperationStatus.CANCELLED
         
-        return False
+        # Remove from queue (the heap entry is left as a tombstone)
+        if self._queued.pop(operation_id, None) is not None:
+            del self._by_id[operation_id]
+            logger.info(f"Cancelled queued operation: {operation_id}")
+        else:
+            logger.info(f"Cancelled active operation: {operation_id}")
+        return True
     
     async def rate_limit_check(self, repository: str) -> Dict[str, Any]:
         """Check GitHub API rate limits"""
@@ -449,31 +1075,23 @@ class GitWaitServer:
                 "should_wait": False
             }
         
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+        # Every GitHub response carries the rate-limit headers, so a recent
+        # status poll already tells us everything /rate_limit would
+        state = self._rate_state
+        if state is not None and time.monotonic() - state["updated_at"] < RATE_STATE_MAX_AGE:
+            return self._rate_limit_summary(state["remaining"], state["limit"], state["reset"])
         
         try:
-            response = requests.get("https://api.github.com/rate_limit", headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            _, data, _ = await self._http_get("https://api.github.com/rate_limit", timeout=10, throttle=False)
             
             core_rate = data.get("rate", {})
-            remaining = core_rate.get("remaining", 0)
-            reset_time = core_rate.get("reset", 0)
-            
-            should_wait = remaining < 100  # Wait if less than 100 requests remaining
-            
-            return {
-                "rate_limit_remaining": remaining,
-                "rate_limit_total": core_rate.get("limit", 0),
-                "reset_time": datetime.fromtimestamp(reset_time).isoformat(),
-                "should_wait": should_wait,
-                "recommended_wait": self.config.rate_limit_delay if should_wait else 0
-            }
+            return self._rate_limit_summary(
+                core_rate.get("remaining", 0),
+                core_rate.get("limit", 0),
+                core_rate.get("reset", 0)
+            )
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Rate limit check failed: {str(e)}")
             return {
                 "error": str(e),
@@ -624,6 +1242,18 @@ async def handle_list_tools() -> List[types.Tool]:
         )
     ]
 
+def _queued_summary(op: GitOperation) -> Dict[str, Any]:
+    return {
+        "id": op.id,
+        "command": op.command,
+        "status": op.status.value,
+        "priority": op.priority,
+        "wait_type": op.wait_type.value
+    }
+
+def _active_summary(op: GitOperation) -> Dict[str, Any]:
+    return {"id": op.id, "command": op.command, "status": op.status.value}
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls"""
@@ -634,7 +1264,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
                 commit_sha=arguments["commit_sha"],
                 timeout=arguments.get("timeout")
             )
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "wait_for_pr_merge":
             result = await gitwait.wait_for_pr_merge(
@@ -642,7 +1272,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
                 pr_number=arguments["pr_number"],
                 timeout=arguments.get("timeout")
             )
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "queue_git_operation":
             operation_id = await gitwait.queue_git_operation(
@@ -654,49 +1284,33 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
                 repository=arguments.get("repository")
             )
             result = {"operation_id": operation_id, "status": "queued"}
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "get_operation_status":
             result = await gitwait.get_operation_status(arguments["operation_id"])
             if result is None:
                 result = {"error": "Operation not found"}
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "cancel_operation":
             success = await gitwait.cancel_operation(arguments["operation_id"])
             result = {"cancelled": success}
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "check_rate_limits":
             result = await gitwait.rate_limit_check(
                 repository=arguments.get("repository", "")
             )
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         elif name == "get_queue_status":
             result = {
-                "queued_operations": len(gitwait.operation_queue),
+                "queued_operations": len(gitwait._queued),
                 "active_operations": len(gitwait.active_operations),
-                "queue": [
-                    {
-                        "id": op.id,
-                        "command": op.command,
-                        "status": op.status.value,
-                        "priority": op.priority,
-                        "wait_type": op.wait_type.value
-                    }
-                    for op in gitwait.operation_queue[:10]  # Show first 10
-                ],
-                "active": [
-                    {
-                        "id": op.id,
-                        "command": op.command,
-                        "status": op.status.value
-                    }
-                    for op in gitwait.active_operations.values()
-                ]
+                "queue": [_queued_summary(op) for op in gitwait.queued_operations(10)],  # Show first 10
+                "active": [_active_summary(op) for op in gitwait.active_operations.values()]
             }
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_dumps(result))]
         
         else:
             return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -717,12 +1331,20 @@ async def main():
         )
     )
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            options
-        )
+    if gitwait.config.webhook_port:
+        await gitwait.start_webhook_listener(gitwait.config.webhook_port)
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                options
+            )
+    finally:
+        await gitwait.stop_webhook_listener()
+        await gitwait.stop_workers()
+        await gitwait.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+The GraphQL and REST CI status paths must agree on state and shape
+"""
+import asyncio
+
+import pytest
+
+from gitwait_server import GitWaitServer
+
+REPOSITORY = "owner/repo"
+SHA = "abc123"
+
+# (context, state) commit statuses and (name, status, conclusion) check runs, as REST spells them
+CASES = {
+    "all_green": ([("ci/build", "success")], [("lint", "completed", "success"), ("docs", "completed", "skipped")]),
+    "run_in_progress": ([("ci/build", "success")], [("tests", "in_progress", None)]),
+    "run_failed": ([("ci/build", "success")], [("tests", "completed", "failure")]),
+    "status_failed": ([("ci/build", "failure")], [("tests", "completed", "success")]),
+    "status_pending": ([("ci/build", "pending")], [("tests", "completed", "success")]),
+    "checks_only": ([], [("tests", "completed", "success")]),
+    "nothing_reported": ([], []),
+}
+
+EXPECTED_STATES = {
+    "all_green": "success",
+    "run_in_progress": "pending",
+    "run_failed": "failure",
+    "status_failed": "failure",
+    "status_pending": "pending",
+    "checks_only": "success",
+    "nothing_reported": "pending",
+}
+
+
+def _rest_responses(statuses, runs):
+    combined = {
+        "state": "success",  # ignored: the combined status doesn't see check runs
+        "total_count": len(statuses),
+        "statuses": [
+            {"state": state, "context": context, "description": None,
+             "target_url": f"https://ci.example/{context}", "id": 1}
+            for context, state in statuses
+        ],
+    }
+    check_runs = {
+        "total_count": len(runs),
+        "check_runs": [
+            {"name": name, "status": status, "conclusion": conclusion,
+             "html_url": f"https://github.com/{REPOSITORY}/runs/{name}", "id": 2}
+            for name, status, conclusion in runs
+        ],
+    }
+    return combined, check_runs
+
+
+def _graphql_response(statuses, runs):
+    return {
+        "repository": {
+            "object": {
+                "status": {
+                    "contexts": [
+                        {"state": state.upper(), "context": context, "description": None,
+                         "targetUrl": f"https://ci.example/{context}"}
+                        for context, state in statuses
+                    ]
+                } if statuses else None,
+                "checkSuites": {
+                    "pageInfo": {"hasNextPage": False},
+                    "nodes": [{
+                        "checkRuns": {
+                            "pageInfo": {"hasNextPage": False},
+                            "nodes": [
+                                {"name": name, "status": status.upper(),
+                                 "conclusion": conclusion.upper() if conclusion else None,
+                                 "detailsUrl": f"https://github.com/{REPOSITORY}/runs/{name}"}
+                                for name, status, conclusion in runs
+                            ],
+                        }
+                    }],
+                },
+            }
+        }
+    }
+
+
+def _server(monkeypatch, graphql: bool, statuses, runs) -> GitWaitServer:
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    server = GitWaitServer()
+    server._graphql_enabled = graphql
+    combined, check_runs = _rest_responses(statuses, runs)
+
+    async def graphql_query(query, variables, timeout=30):
+        return _graphql_response(statuses, runs)
+
+    async def cached_get(url, ttl, raise_for_status=True):
+        return 200, combined
+
+    async def get_check_runs(url):
+        return 200, check_runs
+
+    server._graphql_query = graphql_query
+    server._cached_get = cached_get
+    server._get_check_runs = get_check_runs
+    return server
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_graphql_and_rest_paths_agree(monkeypatch, case):
+    statuses, runs = CASES[case]
+    via_graphql = asyncio.run(_server(monkeypatch, True, statuses, runs)._check_ci_status(REPOSITORY, SHA))
+    via_rest = asyncio.run(_server(monkeypatch, False, statuses, runs)._check_ci_status(REPOSITORY, SHA))
+
+    assert via_graphql == via_rest
+    assert via_rest["state"] == EXPECTED_STATES[case]